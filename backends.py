@@ -0,0 +1,278 @@
+"""
+Where get_text fetches feeds from and where it caches them.
+
+A backend has:
+
+   get(key) -> cached value, or None
+   set(key, value, time=seconds until it expires, 0 for never)
+   get_multi(keys) -> {key: cached value} for the keys we have
+   set_multi({key: value}, time=...)
+   incr(key, delta=1, time=...) -> new value, starting from 0 for a key
+       we don't have, which then expires after time
+   fetch(url, headers, deadline=None) -> (status_code, content), raising
+       if it can't, or if it takes longer than deadline seconds
+   hedges: true if fetches can run in threads, see hedged_fetch
+
+AppEngineBackend is what we run with in production.  LocalBackend and
+FixtureBackend don't need app engine, so the feed code can be profiled
+and benchmarked anywhere.
+"""
+
+import os
+import cgi
+import time
+import urllib
+import urllib2
+import hashlib
+import threading
+import Queue
+
+
+def canonical_url(url):
+    """ the same url with its query arguments sorted, so urls we build
+    by walking a dict still match ones we recorded """
+
+    base, _, query = url.partition("?")
+    args = sorted(cgi.parse_qsl(query, keep_blank_values=True))
+    return base + "?" + urllib.urlencode(args)
+
+def feed_kind(url):
+    """ vehicleLocations, predictionsForMultiStops, routeConfig, ... or subway """
+
+    base, _, query = url.partition("?")
+    command = dict(cgi.parse_qsl(query)).get("command")
+    if command:
+        return command
+    return "subway"
+
+def hedged_fetch(fetch, hedge_after, deadline, may_hedge=lambda: True):
+    """ fetch(), and if that hasn't answered in /hedge_after/ seconds,
+    fetch() again (if may_hedge()) and take whichever works first
+
+    Returns ((status_code, content), hedged, whether the second one won).
+    Raises what the last fetch raised if neither works.
+    """
+
+    answers = Queue.Queue()
+    def attempt(n):
+        try:
+            answers.put((n, fetch(), None))
+        except Exception, e:
+            answers.put((n, None, e))
+
+    def start(n):
+        t = threading.Thread(target=attempt, args=(n,))
+        t.setDaemon(True)
+        t.start()
+
+    give_up = time.time() + deadline
+    start(0)
+    hedged = False
+    try:
+        answer = answers.get(timeout=hedge_after)
+    except Queue.Empty:
+        answer = None
+        if may_hedge():
+            start(1)
+            hedged = True
+
+    attempts = hedged and 2 or 1
+    answered = 0
+    while True:
+        if answer is not None:
+            answered += 1
+            n, result, error = answer
+            if error is None and result[0] == 200:
+                return result, hedged, n == 1
+            if answered == attempts:
+                if error is not None:
+                    raise error
+                return result, hedged, n == 1
+        try:
+            answer = answers.get(timeout=max(0, give_up - time.time()))
+        except Queue.Empty:
+            raise IOError("no answer in %ss" % deadline)
+
+
+class AppEngineBackend(object):
+
+    """ urlfetch and memcache """
+
+    def __init__(self):
+        from google.appengine.api import urlfetch
+        from google.appengine.api import memcache
+
+        self.urlfetch = urlfetch
+        self.cache = memcache.Client()
+
+    def get(self, key):
+        return self.cache.get(key)
+
+    def set(self, key, value, time=0):
+        return self.cache.set(key, value, time=time)
+
+    def get_multi(self, keys):
+        return self.cache.get_multi(keys)
+
+    def set_multi(self, mapping, time=0):
+        return self.cache.set_multi(mapping, time=time)
+
+    def incr(self, key, delta=1, time=0):
+        n = self.cache.incr(key, delta)
+        if n is None:
+            # incr can't give a new key an expiry, add can
+            if self.cache.add(key, delta, time=time):
+                return delta
+            n = self.cache.incr(key, delta)
+        return n
+
+    # no threads on app engine, and no waiting on an rpc for less than
+    # all of it, so we can't hedge
+    hedges = False
+
+    def fetch(self, url, headers, deadline=None):
+        result = self.urlfetch.fetch(url=url, headers=headers, deadline=deadline)
+        return result.status_code, result.content
+
+
+class DictCache(object):
+
+    """ enough of memcache.Client, in this process """
+
+    clock = staticmethod(time.time)
+
+    def __init__(self):
+        self.values = {} # key -> (expires or 0, value)
+
+    def get(self, key):
+        try:
+            expires, value = self.values[key]
+        except KeyError:
+            return None
+        if expires and expires < self.clock():
+            del self.values[key]
+            return None
+        return value
+
+    def set(self, key, value, time=0):
+        if time:
+            expires = self.clock() + time
+        else:
+            expires = 0
+        self.values[key] = expires, value
+        return True
+
+    def get_multi(self, keys):
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    def set_multi(self, mapping, time=0):
+        for key, value in mapping.items():
+            self.set(key, value, time=time)
+        return []
+
+    def incr(self, key, delta=1, time=0):
+        value = self.get(key)
+        if value is None:
+            self.set(key, delta, time=time)
+            return delta
+        expires, value = self.values[key]
+        self.values[key] = expires, value + delta
+        return value + delta
+
+    def clear(self):
+        self.values.clear()
+
+
+class LocalBackend(object):
+
+    """ a dict for a cache and urllib2 for fetching """
+
+    def __init__(self):
+        self.cache = DictCache()
+
+    def get(self, key):
+        return self.cache.get(key)
+
+    def set(self, key, value, time=0):
+        return self.cache.set(key, value, time=time)
+
+    def get_multi(self, keys):
+        return self.cache.get_multi(keys)
+
+    def set_multi(self, mapping, time=0):
+        return self.cache.set_multi(mapping, time=time)
+
+    def incr(self, key, delta=1, time=0):
+        return self.cache.incr(key, delta, time=time)
+
+    hedges = True
+
+    def fetch(self, url, headers, deadline=None):
+        try:
+            f = urllib2.urlopen(urllib2.Request(url, headers=headers), timeout=deadline)
+        except urllib2.HTTPError, e:
+            return e.code, e.read()
+        try:
+            return f.code, f.read()
+        finally:
+            f.close()
+
+
+class FixtureBackend(LocalBackend):
+
+    """ serve recorded feeds, optionally slowly
+
+    Feeds are files in fixture_dir named by the sha1 of their canonical
+    url.  Urls we don't have are a 404, unless we're recording, in which
+    case we fetch them and save them.
+
+    latency: seconds to wait before answering each fetch; fetches with
+        a shorter deadline time out
+    counts: feed kind -> fetches
+    missing: urls we had no fixture for
+    """
+
+    def __init__(self, fixture_dir, latency=0, record=False):
+        LocalBackend.__init__(self)
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.record = record
+        self.counts = {}
+        self.missing = set()
+
+    def fname(self, url):
+        return os.path.join(self.fixture_dir,
+                            hashlib.sha1(canonical_url(url)).hexdigest())
+
+    def fetch(self, url, headers, deadline=None):
+        kind = feed_kind(url)
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+
+        fname = self.fname(url)
+        if os.path.exists(fname):
+            if deadline is not None and self.latency > deadline:
+                time.sleep(deadline)
+                raise IOError("no answer in %ss" % deadline)
+            if self.latency:
+                time.sleep(self.latency)
+            f = open(fname, "rb")
+            try:
+                return 200, f.read()
+            finally:
+                f.close()
+
+        if not self.record:
+            self.missing.add(url)
+            return 404, ""
+
+        status_code, content = LocalBackend.fetch(self, url, headers, deadline)
+        if status_code == 200:
+            f = open(fname, "wb")
+            f.write(content)
+            f.close()
+        return status_code, content
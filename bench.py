@@ -0,0 +1,438 @@
+"""
+Microbenchmarks for the hot paths.  Doesn't need app engine.
+
+  python bench.py feeds FIXTURE_DIR ROUTE [SUBWAY_LINE]
+     - request_buses, request_predictions and the subway parser against
+       feeds recorded with replay.py --record, with a cold and a warm cache
+
+  python bench.py predictions [recorded.xml ...]
+     - reducing predictionsForMultiStops documents to each bus's next stop
+     - with no files we make up a large document
+
+  python bench.py snap [n_points]
+     - projecting points onto a route path, scanning every segment vs
+       the bucketed index
+
+  python bench.py icons
+     - png.Writer's fast path vs write_passes on icon sized images
+     - mkicons for every heading, with and without numpy
+     - drawing arrows and badges for /icon
+
+  python bench.py png [width]
+     - filtering and unfiltering a width pixel RGBA scanline with each
+       filter type, with and without numpy
+     - writing and reading back a width x width gradient, per filter_type
+
+  python bench.py json [n_buses] [n_stops]
+     - serializing a Buses answer (snapped) and a Paths answer with each
+       json encoder we have: simplejson and the standard library's
+       json, pure python and C.  json_impl.py picks the fastest.
+     - and with jsonwriter, which is what Buses and Paths use
+"""
+
+import sys
+import time
+import array
+import cStringIO
+import random
+import logging
+import xml.dom.minidom as minidom
+
+import predictions
+import geometry
+import backends
+import feeds
+import png
+import mkicons
+import icons
+import json_impl
+import jsonwriter
+import simplejson
+
+
+def best_time(f, repeat=5, number=None):
+    """ seconds per call of f, best of /repeat/ runs """
+
+    if number is None:
+        # aim for runs of about a tenth of a second
+        number = 1
+        while True:
+            start = time.time()
+            for i in xrange(number):
+                f()
+            if time.time() - start > 0.1:
+                break
+            number *= 4
+
+    times = []
+    for r in range(repeat):
+        start = time.time()
+        for i in xrange(number):
+            f()
+        times.append((time.time() - start) / number)
+    return min(times)
+
+def report(name, secs, rows=None, nbytes=None):
+    line = "%-40s %10.3f ms" % (name, secs*1000)
+    if rows:
+        line += " %10.0f rows/s" % (rows/secs)
+    if nbytes:
+        line += " %10.1f MB/s" % (nbytes/secs/1e6)
+    print line
+
+
+class FakeStop(object):
+    def __init__(self, tag, lat, lon):
+        self.tag, self.lat, self.lon = tag, lat, lon
+
+class FakeBus(object):
+    def __init__(self, lat, lon):
+        self.lat, self.lon = lat, lon
+
+def random_loc(rand):
+    return 42.2 + rand.random()*.2, -71.2 + rand.random()*.2
+
+def make_predictions_doc(n_stops=400, n_buses=60, per_stop=5, seed=0):
+    """ something shaped like a big predictionsForMultiStops answer """
+
+    rand = random.Random(seed)
+    out = ['<?xml version="1.0" encoding="utf-8" ?>\n<body copyright="">']
+    for s in range(n_stops):
+        out.append('<predictions agencyTitle="MBTA" routeTag="1" stopTag="%s">' % s)
+        out.append('<direction title="Outbound">')
+        for p in range(per_stop):
+            out.append('<prediction seconds="0" minutes="%s" isDeparture="false"'
+                       ' dirTag="1_0_var%s" vehicle="%s" block="01" />' % (
+                    rand.randint(0, 60), rand.randint(0, 1), rand.randint(0, n_buses-1)))
+        out.append('</direction></predictions>')
+    out.append('</body>')
+    return "".join(out)
+
+def bench_predictions(args):
+    if args:
+        texts = [open(fname).read() for fname in args]
+    else:
+        texts = [make_predictions_doc()]
+
+    docs = [minidom.parseString(text) for text in texts]
+
+    # recorded documents don't tell us where stops or buses are, so make
+    # up locations
+    rand = random.Random(1)
+    stops = {}
+    bus_hash = {}
+    for doc in docs:
+        for p in doc.getElementsByTagName("predictions"):
+            tag = p.getAttribute("stopTag")
+            if tag not in stops:
+                lat, lon = random_loc(rand)
+                stops[tag] = FakeStop(tag, lat, lon)
+        for p in doc.getElementsByTagName("prediction"):
+            vehicle = p.getAttribute("vehicle")
+            if vehicle not in bus_hash:
+                bus_hash[vehicle] = FakeBus(*random_loc(rand))
+
+    def collect():
+        table = predictions.PredictionTable(stops, bus_hash)
+        for doc in docs:
+            table.add(doc, 3)
+        return table
+
+    table = collect()
+    rows = len(table)
+    print "%s rows, %s stops, %s vehicles" % (rows, len(stops), len(bus_hash))
+
+    report("parse", best_time(lambda: [minidom.parseString(t) for t in texts]), rows)
+    report("collect rows", best_time(collect), rows)
+    report("reduce (loop)", best_time(lambda: table.best(use_numpy=False)), rows)
+
+    if predictions.numpy is not None:
+        assert table.best(use_numpy=True) == table.best(use_numpy=False)
+        report("reduce (numpy)", best_time(lambda: table.best(use_numpy=True)), rows)
+    else:
+        print "numpy not available"
+
+
+def make_path(n_points, seed=0):
+    """ a wandering path about 100m between points """
+
+    rand = random.Random(seed)
+    lat, lon = 42.3, -71.1
+    points = []
+    for n in range(n_points):
+        points.append((lat, lon))
+        lat += (rand.random()-.3)*.0012
+        lon += (rand.random()-.3)*.0016
+    return points
+
+def bench_snap(args):
+    n_points = 150
+    if args:
+        n_points = int(args[0])
+
+    index = geometry.SegmentIndex(make_path(n_points))
+    rand = random.Random(2)
+    queries = []
+    for n in range(200):
+        lat, lon = index.points[rand.randint(0, n_points-1)]
+        queries.append((lat + (rand.random()-.5)*.003, lon + (rand.random()-.5)*.003))
+    xys = [geometry.to_xy(lat, lon) for lat, lon in queries]
+
+    for x, y in xys:
+        assert index.closest_linear(x, y)[2] == index.closest_bucketed(x, y)[2]
+
+    print "%s segments, %s cells, %.0fm long" % (len(index), len(index.cells), index.length)
+
+    report("build index", best_time(lambda: geometry.SegmentIndex(index.points)))
+    report("200 projections (linear)",
+           best_time(lambda: [index.closest_linear(x, y) for x, y in xys]))
+    report("200 projections (bucketed)",
+           best_time(lambda: [index.closest_bucketed(x, y) for x, y in xys]))
+    report("200 projections (bucketed, 300m max)",
+           best_time(lambda: [index.closest_bucketed(x, y, geometry.MAX_SNAP_METERS)
+                              for x, y in xys]))
+
+
+def bench_feeds(args):
+    if len(args) < 2:
+        sys.stderr.write("usage: bench.py feeds FIXTURE_DIR ROUTE [SUBWAY_LINE]\n")
+        return
+    fixture_dir, route = args[0], args[1]
+    line = "Red"
+    if len(args) > 2:
+        line = args[2]
+
+    backend = feeds.backend = backends.FixtureBackend(fixture_dir)
+    # every missing fixture would log a warning per run
+    logging.getLogger().setLevel(logging.ERROR)
+
+    def cold(f):
+        def g():
+            backend.cache.clear()
+            return f()
+        return g
+
+    # route configs are kept for good, in production too
+    feeds.request_paths(route)
+    bus_hash = feeds.request_buses(route)
+    print "route %s: %s buses" % (route, len(bus_hash))
+
+    for name, f in [("request_buses", lambda: feeds.request_buses(route)),
+                    ("request_predictions", lambda: feeds.request_predictions(route, bus_hash)),
+                    ("update_predictions", lambda: feeds.update_predictions(route, bus_hash)),
+                    ("request_subways_literal", lambda: feeds.request_subways_literal(line)),
+                    ("request_subways", lambda: feeds.request_subways(line)),
+                    ]:
+        report("%s (cold)" % name, best_time(cold(f)))
+        report("%s (warm)" % name, best_time(f))
+
+    if backend.missing:
+        print "no fixtures for %s urls, e.g. %s" % (
+            len(backend.missing), sorted(backend.missing)[0])
+
+
+def bench_icons(args):
+    headings = range(0, 360, 3)
+
+    for size in (16, 48):
+        rows = list(mkicons.get_img(90, size=size))
+        w = png.Writer(width=size, height=size, alpha=True)
+        report("png write_passes %sx%s RGBA" % (size, size),
+               best_time(lambda: w.write_passes(cStringIO.StringIO(), rows)))
+        report("png write_fast %sx%s RGBA" % (size, size),
+               best_time(lambda: w.write_fast(cStringIO.StringIO(), rows)))
+
+    def all_headings(size, use_numpy):
+        w = png.Writer(width=size, height=size, alpha=True)
+        covered = mkicons.coverage(headings, size, mkicons.scale, use_numpy)
+        for h in headings:
+            w.write(cStringIO.StringIO(), mkicons.rgba_rows(covered[h]))
+
+    for size in (16, 32):
+        report("mkicons %s headings %spx (loop)" % (len(headings), size),
+               best_time(lambda: all_headings(size, False), repeat=1, number=1))
+        if mkicons.numpy is not None:
+            report("mkicons %s headings %spx (numpy)" % (len(headings), size),
+                   best_time(lambda: all_headings(size, True)))
+
+    report("/icon arrow 16px", best_time(
+            lambda: icons.draw(icons.normalize({"heading": "90"}))))
+    report("/icon arrow 16px scale 2", best_time(
+            lambda: icons.draw(icons.normalize({"heading": "90", "scale": "2"}))))
+    report("/icon badge scale 2", best_time(
+            lambda: icons.draw(icons.normalize({"min": "12", "scale": "2"}))))
+    icons.render({"heading": "90"})
+    report("/icon arrow, from the lru", best_time(
+            lambda: icons.render({"heading": "90"})))
+
+def bench_png(args):
+    width = args and int(args[0]) or 1024
+    fo = 4
+    random.seed(0)
+    line = array.array('B', [random.randrange(256) for i in range(4*width)])
+    prev = array.array('B', [random.randrange(256) for i in range(4*width)])
+    reader = png.Reader(bytes=png._signature)
+    reader.psize = fo
+
+    ways = [(False, "array")]
+    if png.numpy is not None:
+        ways.append((True, "numpy"))
+    for use_numpy, way in ways:
+        for type in range(1, 5):
+            report("filter %s %spx (%s)" % (type, width, way), best_time(
+                    lambda: png.filter_scanline(type, line, fo, prev, use_numpy)),
+                   nbytes=len(line))
+        report("filter adaptive %spx (%s)" % (width, way), best_time(
+                lambda: png.adaptive_filter(line, fo, prev, use_numpy)),
+               nbytes=len(line))
+
+    for type in range(1, 5):
+        filtered = png.filter_scanline(type, line, fo, prev)[1:]
+        report("unfilter %s %spx" % (type, width), best_time(
+                lambda: reader.undo_filter(type, filtered, prev)),
+               nbytes=len(line))
+
+    size = min(width, 256)
+    rows = [array.array('B', [(x + y) & 0xff for x in range(4*size)])
+            for y in range(size)]
+    for filter_type in (0, 1, 2, 4, "adaptive"):
+        w = png.Writer(width=size, height=size, alpha=True, filter_type=filter_type)
+        out = cStringIO.StringIO()
+        w.write(out, rows)
+        data = out.getvalue()
+        report("write %sx%s filter %s, %s bytes" % (size, size, filter_type, len(data)),
+               best_time(lambda: w.write(cStringIO.StringIO(), rows), repeat=3),
+               nbytes=4*size*size)
+        report("read %sx%s filter %s" % (size, size, filter_type),
+               best_time(lambda: list(png.Reader(bytes=data).read()[2]), repeat=3),
+               nbytes=4*size*size)
+
+def make_sendables(n_buses=200, seed=0):
+    """ something shaped like a big snapped Buses answer """
+
+    rand = random.Random(seed)
+    now = time.time()
+    sendables = []
+    for n in range(n_buses):
+        lat, lon = random_loc(rand)
+        bus = feeds.Vehicle(t=now - rand.randint(0, 120), lat=lat, lon=lon,
+                            preds=(now + rand.randint(0, 300),) + random_loc(rand),
+                            id=str(1000 + n), dirTag="%s_%s_var0" % (n % 40, n % 2),
+                            heading=rand.randint(0, 359), type="bus")
+        sendable = bus.sendable(now=now)
+        sendable["along_i"] = rand.randint(0, 20000)
+        sendable["along_j"] = rand.randint(0, 20000)
+        sendables.append(sendable)
+    return sendables
+
+class FakeDirection(object):
+    def __init__(self, tag, stops):
+        self.tag, self.stops = tag, stops
+        self.along = [n*137.5 for n in range(len(stops))]
+
+def make_paths(n_stops=150, seed=0):
+    """ (directions, stops) like request_paths: two directions over
+    the same stops """
+
+    rand = random.Random(seed)
+    stops = [FakeStop(str(n), *random_loc(rand)) for n in range(n_stops)]
+    for stop in stops:
+        stop.title = "Stop %s" % stop.tag
+    directions = {"out": FakeDirection("out", stops),
+                  "in": FakeDirection("in", stops[::-1])}
+    return directions, dict((stop.tag, stop) for stop in stops)
+
+def make_paths_answer(directions, stops):
+    """ what the Paths handler used to hand json.dumps """
+
+    return {"directions": dict((d.tag, [[{"lat": stop.lat, "lon": stop.lon} for stop in d.stops]])
+                               for d in directions.values()),
+            "along": dict((d.tag, [int(along) for along in d.along])
+                          for d in directions.values()),
+            "stops": [{"lat": stop.lat, "lon": stop.lon, "title": stop.title,
+                       "tag": stop.tag} for stop in stops.values()]}
+
+def json_encoders():
+    """ [(name, dumps)] for every encoder we can run """
+
+    def pure(module):
+        # the encoders look their C helpers up each time they're used
+        encoder = module.encoder
+        def dumps(obj):
+            c = encoder.c_make_encoder, encoder.encode_basestring_ascii
+            encoder.c_make_encoder = None
+            encoder.encode_basestring_ascii = encoder.py_encode_basestring_ascii
+            try:
+                return module.dumps(obj)
+            finally:
+                encoder.c_make_encoder, encoder.encode_basestring_ascii = c
+        return dumps
+
+    encoders = [("simplejson, pure python", pure(simplejson))]
+    if json_impl.speedups(simplejson):
+        encoders.append(("simplejson, speedups", simplejson.dumps))
+    if json_impl.stdlib_json is not None:
+        encoders.append(("json, pure python", pure(json_impl.stdlib_json)))
+        if json_impl.speedups(json_impl.stdlib_json):
+            encoders.append(("json, C encoder", json_impl.stdlib_json.dumps))
+    return encoders
+
+def same_json(a, b, places=6):
+    """ are two parsed json answers the same, to /places/ for floats? """
+
+    if isinstance(a, float) or isinstance(b, float):
+        return round(a - b, places) == 0
+    if isinstance(a, dict):
+        return sorted(a) == sorted(b) and all(same_json(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same_json(x, y) for x, y in zip(a, b))
+    return a == b
+
+def bench_json(args):
+    n_buses = args and int(args[0]) or 200
+    n_stops = len(args) > 1 and int(args[1]) or 150
+
+    def writer(write, *objs):
+        def dumps(payload):
+            out = cStringIO.StringIO()
+            write(out, *objs)
+            return out.getvalue()
+        return dumps
+
+    print "using: %s" % json_impl.active
+    sendables = make_sendables(n_buses)
+    routes = dict((str(n), make_sendables(n_buses/10, seed=n)) for n in range(10))
+    directions, stops = make_paths(n_stops)
+    payloads = (("Buses x%s" % n_buses, sendables,
+                 writer(jsonwriter.write_vehicles, sendables)),
+                ("Buses?routes= 10x%s" % (n_buses/10), routes,
+                 writer(jsonwriter.write_routes, routes)),
+                ("Paths x%s" % n_stops, make_paths_answer(directions, stops),
+                 writer(jsonwriter.write_paths, directions, stops)))
+    for payload_name, payload, write in payloads:
+        expected = simplejson.loads(simplejson.dumps(payload))
+        for name, dumps in json_encoders() + [("jsonwriter", write)]:
+            text = dumps(payload)
+            assert same_json(simplejson.loads(text), expected)
+            report("%s (%s)" % (payload_name, name), best_time(lambda: dumps(payload)),
+                   nbytes=len(text))
+
+
+BENCHMARKS = {
+    "feeds": bench_feeds,
+    "icons": bench_icons,
+    "json": bench_json,
+    "png": bench_png,
+    "predictions": bench_predictions,
+    "snap": bench_snap,
+    }
+
+def main(argv):
+    if len(argv) < 2 or argv[1] not in BENCHMARKS:
+        sys.stderr.write("usage: %s (%s) [args]\n" % (
+                argv[0], "|".join(sorted(BENCHMARKS))))
+        return 1
+    BENCHMARKS[argv[1]](argv[2:])
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
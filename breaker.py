@@ -0,0 +1,199 @@
+"""
+Not fetching from upstreams that are down
+
+A breaker counts consecutive failures.  Once there are enough of them it
+opens, and for a while nothing gets through: get_text serves what's
+cached, or fails, without waiting on a fetch that won't work.  When
+that while is up one probe fetch is let through.  If it works the
+breaker closes; if not it opens again for twice as long.
+
+There's a breaker for each host, which opens after a few failures in a
+row from anywhere on it, and one for each url, which opens on the first
+failure.  The url breakers are our negative cache: a url that just
+failed isn't tried again for NEGATIVE_SECONDS, then a little longer each
+time it keeps failing.  We only keep breakers for urls that are failing;
+one is dropped when its url works again, or when nobody has tried it
+for a while.
+
+   if breaker.breakers.allow(url):
+       ... fetch ...
+       breaker.breakers.succeeded(url) or breaker.breakers.failed(url)
+
+and if we're let through but don't fetch after all,
+breaker.breakers.release(url).
+
+What breakers know is per instance.
+"""
+
+import time
+import urlparse
+import threading
+
+# a host's breaker opens after this many failures in a row
+HOST_FAILURES = 5
+HOST_OPEN_SECONDS, HOST_MAX_OPEN_SECONDS = 10, 120
+
+# a url that failed isn't fetched again for this long, doubling up to the
+# max while it keeps failing
+NEGATIVE_SECONDS, MAX_NEGATIVE_SECONDS = 5, 60
+
+# if a probe hasn't said how it went after this long, let another one try
+PROBE_TIMEOUT = 30
+
+# a url's breaker is forgotten once it's been ready to try again for this
+# long without anyone trying
+FORGET_SECONDS = 10*60
+
+
+class Breaker(object):
+
+    """ closed, open, or half open waiting on a probe """
+
+    def __init__(self, threshold, open_seconds, max_open_seconds):
+        self.threshold = threshold
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.backoff = open_seconds
+        self.failures = 0 # in a row
+        self.open_until = 0
+        self.probing = None # when the current probe started
+
+    def state(self, now):
+        if self.failures < self.threshold:
+            return "closed"
+        if now < self.open_until:
+            return "open"
+        return "half_open"
+
+    def ready(self, now):
+        """ would we let a fetch through? """
+
+        state = self.state(now)
+        if state == "closed":
+            return True
+        if state == "open":
+            return False
+        return self.probing is None or now - self.probing > PROBE_TIMEOUT
+
+    def start(self, now):
+        """ a fetch is going through """
+
+        if self.state(now) == "half_open":
+            self.probing = now
+
+    def release(self):
+        """ the fetch didn't go through after all """
+
+        self.probing = None
+
+    def succeeded(self):
+        self.failures = 0
+        self.backoff = self.open_seconds
+        self.probing = None
+
+    def failed(self, now):
+        if self.probing is not None:
+            # a failed probe, back off further
+            self.backoff = min(2*self.backoff, self.max_open_seconds)
+            self.probing = None
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.open_until = now + self.backoff
+
+
+class Breakers(object):
+
+    """ a breaker for every host we fetch from, and for every url that's
+    failing """
+
+    clock = staticmethod(time.time)
+
+    def __init__(self):
+        self.hosts = {}
+        self.urls = {}
+        self.lock = threading.Lock()
+
+    def breakers(self, url):
+        """ (host breaker, url breaker); hold self.lock.  A url that
+        isn't failing gets a closed breaker that isn't kept """
+
+        host = urlparse.urlsplit(url)[1]
+        if host not in self.hosts:
+            self.hosts[host] = Breaker(HOST_FAILURES, HOST_OPEN_SECONDS,
+                                       HOST_MAX_OPEN_SECONDS)
+        url_breaker = self.urls.get(url)
+        if url_breaker is None:
+            url_breaker = Breaker(1, NEGATIVE_SECONDS, MAX_NEGATIVE_SECONDS)
+        return self.hosts[host], url_breaker
+
+    def forget(self, now):
+        """ drop url breakers nobody has tried in a while; hold self.lock """
+
+        for url, b in self.urls.items():
+            if b.probing is None and now - b.open_until > FORGET_SECONDS:
+                del self.urls[url]
+
+    def allow(self, url):
+        """ may we fetch /url/?  If so, say how it went afterwards """
+
+        now = self.clock()
+        self.lock.acquire()
+        try:
+            for b in self.breakers(url):
+                if not b.ready(now):
+                    return False
+            for b in self.breakers(url):
+                b.start(now)
+            return True
+        finally:
+            self.lock.release()
+
+    def release(self, url):
+        """ allow() let us through but we didn't fetch; if we were the
+        probe, let another one try """
+
+        self.lock.acquire()
+        try:
+            for b in self.breakers(url):
+                b.release()
+        finally:
+            self.lock.release()
+
+    def succeeded(self, url):
+        self.lock.acquire()
+        try:
+            for b in self.breakers(url):
+                b.succeeded()
+            self.urls.pop(url, None)
+        finally:
+            self.lock.release()
+
+    def failed(self, url):
+        now = self.clock()
+        self.lock.acquire()
+        try:
+            host_breaker, url_breaker = self.breakers(url)
+            host_breaker.failed(now)
+            url_breaker.failed(now)
+            self.forget(now)
+            self.urls[url] = url_breaker
+        finally:
+            self.lock.release()
+
+    def dump(self):
+        """ for /stats: every host, and the urls that aren't closed """
+
+        now = self.clock()
+        self.lock.acquire()
+        try:
+            hosts = dict((host, {"state": b.state(now), "failures": b.failures})
+                         for host, b in self.hosts.items())
+            urls = dict((url, {"state": b.state(now), "failures": b.failures,
+                               "retry_in": round(max(0, b.open_until - now), 1)})
+                        for url, b in self.urls.items()
+                        if b.state(now) != "closed")
+        finally:
+            self.lock.release()
+        return {"hosts": hosts, "urls": urls}
+
+breakers = Breakers()
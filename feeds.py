@@ -0,0 +1,950 @@
+"""
+Fetching and interpreting the nextbus and mbta feeds
+
+Everything here works without app engine's webapp; mbtaplot.py has the
+request handlers.  Fetching and caching go through /backend/, which is
+app engine's urlfetch and memcache when we have them.  To run somewhere
+else, set feeds.backend to one of the other backends.
+"""
+
+from __future__ import with_statement
+import sys
+import time
+import math
+import logging
+import xml.dom.minidom as minidom
+import dateutil.tz
+import datetime
+import route_table
+try:
+    import route_index
+except ImportError:
+    route_index = None
+import predictions
+import geometry
+import backends
+import stats
+import schedule
+import ratelimit
+import breaker
+
+try:
+    backend = backends.AppEngineBackend()
+except ImportError:
+    backend = backends.LocalBackend()
+
+BUS_FEED="http://webservices.nextbus.com/service/publicXMLFeed?"
+SUBWAY_FEED_DIR="http://developer.mbta.com/Data/"
+SUBWAY_KEY="http://developer.mbta.com/RT_Archive/RealTimeHeavyRailKeys.csv"
+
+# how long past its refresh we keep a feed cached, to serve when we
+# can't fetch a new one
+KEEP_STALE = 10*60
+
+# seconds we'll wait for each kind of feed
+DEADLINES = {"vehicleLocations": 4,
+             "predictionsForMultiStops": 5,
+             "predictions": 5,
+             "subway": 5,
+             "routeConfig": 15,
+             "routeList": 15}
+DEFAULT_DEADLINE = 10
+
+# feeds where, if a fetch takes longer than most, we send another and
+# take whichever answers first; only once we've seen enough fetches to
+# know what most is
+HEDGED = ("vehicleLocations", "predictionsForMultiStops", "predictions")
+HEDGE_PERCENTILE = .95
+HEDGE_MIN_FETCHES = 20
+
+def keep_for(refresh):
+    """ memcache expiry for a feed we refresh every /refresh/ seconds """
+
+    if not refresh:
+        return 0
+    return int(refresh) + KEEP_STALE
+
+def is_subway(route):
+    return route in('Red', 'Orange', 'Blue')
+
+# every route in route_table, subways too
+known_routes = frozenset(row[0] for row in route_table.table)
+
+class FailedFetchException(Exception):
+    pass
+
+class InvalidRouteException(Exception):
+    pass
+
+class InvalidStopException(Exception):
+    pass
+
+def get_xml(use_url, refresh=10):
+    """ get xml from url, only updating every /refresh/ seconds """
+
+    return get_text(use_url,refresh=refresh,isxml=True)
+
+def get_xmls(use_urls, refresh=10):
+    """ get_texts, parsed """
+
+    return get_texts(use_urls, refresh=refresh, isxml=True)
+
+NO_CACHE_HEADERS = {"Cache-Control": "no-cache,max-age=0",
+                    "Pragma": "no-cache"}
+
+def get_text(use_url, refresh, isxml=False, headers=NO_CACHE_HEADERS):
+    """
+    Request data from a url with caching and possibly with xml parsing
+    
+    Options:
+
+       refresh: how many seconds to go between cach refreshes
+        - use 0 to disable caching
+        
+       isxml: set to true if we should parse the result
+
+       headers: what headers to use for the request.
+        - by default we just disable caching by intermediate services
+
+    If the fetch fails, breaker says the upstream is failing, or
+    ratelimit says we've been fetching too much, we return the cached
+    value even if it's too old.  If we don't have a cached value we
+    raise a FailedFetchException
+
+    Fetching and caching use /backend/.
+    """
+
+    results = get_texts([use_url], refresh, isxml, headers)
+    if use_url not in results:
+        raise FailedFetchException("Failed to Fetch %s and didn't have it cached" % use_url)
+    return results[use_url]
+
+def get_texts(use_urls, refresh, isxml=False, headers=NO_CACHE_HEADERS):
+    """ get_text for several urls, with one cache lookup for all of them
+    and one cache store for everything we fetched
+
+    refresh is seconds for all of them, or a dict of url -> seconds.
+
+    Returns url -> (result, age).  Urls we couldn't fetch and didn't
+    have cached are left out.
+    """
+
+    with stats.span("cache_get"):
+        cached = backend.get_multi(use_urls)
+
+    results = {}
+    refreshes = {} # url -> seconds, for every url we've looked at
+    stale = {} # feed kind -> [url, ...] the breakers would let us fetch
+    for use_url in use_urls:
+        if use_url in refreshes:
+            continue
+        kind = backends.feed_kind(use_url)
+        if isinstance(refresh, dict):
+            url_refresh = refresh[use_url]
+        else:
+            url_refresh = refresh
+        refreshes[use_url] = url_refresh
+
+        cached_val = cached.get(use_url)
+        if cached_val:
+            result_age, result_val = cached_val
+            results[use_url] = result_val, result_age
+        else:
+            result_age, result_val = 1000, None
+
+        if not result_val or time.time()-result_age > url_refresh:
+            if result_val:
+                stats.count(kind, "cache_expired")
+            else:
+                stats.count(kind, "cache_miss")
+
+            if breaker.breakers.allow(use_url):
+                stale.setdefault(kind, []).append(use_url)
+            else:
+                stats.count(kind, "short_circuited")
+                if result_val:
+                    stats.count(kind, "stale_served")
+                logging.info("upstream failing, not fetching %s" % use_url)
+        else:
+            stats.count(kind, "cache_hit")
+
+    fetched = {} # keep_for -> {url: (age, value)}
+    for kind, stale_urls in stale.items():
+        # one check with everyone's count for all of a kind
+        allowed = ratelimit.limiter.allow_many(kind, len(stale_urls), backend)
+
+        for use_url in stale_urls[allowed:]:
+            breaker.breakers.release(use_url)
+            stats.count(kind, "throttled")
+            if use_url in results:
+                stats.count(kind, "stale_served")
+            logging.warning("over our fetch budget, not fetching %s" % use_url)
+
+        for use_url in stale_urls[:allowed]:
+            logging.info("fetch %s" % use_url)
+
+            fetch_start = time.time()
+            try:
+                status_code, content = fetch(use_url, headers, kind)
+            except Exception:
+                status_code, content = None, None
+            fetch_ms = 1000*(time.time() - fetch_start)
+
+            if status_code == 200:
+                breaker.breakers.succeeded(use_url)
+                stats.fetched(kind, fetch_ms, True, len(content))
+
+                result_age = time.time()
+                results[use_url] = content, result_age
+                fetched.setdefault(keep_for(refreshes[use_url]), {})[use_url] = (
+                    result_age, content)
+            else:
+                breaker.breakers.failed(use_url)
+                stats.fetched(kind, fetch_ms, False)
+                if use_url in results:
+                    stats.count(kind, "stale_served")
+
+                logging.warning("fetch failed status=%s %s" % (
+                        status_code or "result none", use_url))
+
+    for use_url in refreshes:
+        if use_url not in results:
+            stats.count(backends.feed_kind(use_url), "unavailable")
+
+    for keep, values in fetched.items():
+        with stats.span("cache_set"):
+            backend.set_multi(values, time=keep)
+
+    now = time.time()
+    for use_url, (result_val, result_age) in results.items():
+        if isxml:
+            with stats.span("parse"):
+                result_val = minidom.parseString(result_val)
+        results[use_url] = result_val, now-result_age
+    return results
+
+def fetch(use_url, headers, kind):
+    """ backend.fetch with the deadline for /kind/, hedged if it's a
+    kind we hedge and the backend can """
+
+    deadline = DEADLINES.get(kind, DEFAULT_DEADLINE)
+    if kind not in HEDGED or not backend.hedges:
+        return backend.fetch(use_url, headers, deadline)
+
+    hedge_ms = stats.fetch_percentile(kind, HEDGE_PERCENTILE, HEDGE_MIN_FETCHES)
+    if hedge_ms is None or hedge_ms >= 1000*deadline:
+        return backend.fetch(use_url, headers, deadline)
+
+    result, hedged, hedge_won = backends.hedged_fetch(
+        lambda: backend.fetch(use_url, headers, deadline),
+        hedge_ms/1000.0, deadline,
+        lambda: ratelimit.limiter.allow(kind, backend))
+    if hedged:
+        stats.count(kind, "hedged")
+    if hedge_won:
+        stats.count(kind, "hedge_won")
+    return result
+
+def short_name(x, 
+               short_names = {"Line": "SLM",
+                              "701": "CT1",
+                              "747": "CT2S",
+                              "748": "CT2N",
+                              "708" : "CT3",
+                              "CT2-South": "CT2S",
+                              "CT2-North": "CT2N",
+                              }
+               ):
+    """ For some bus routes the route name has numbers where short
+    names are usually used.  For example, 701 for CT1.  Here we
+    correct for this. """
+
+    x = str(x).split()[-1]
+    return short_names.get(x,x)
+
+
+
+class Vehicle(object):
+
+    """ Represents a bus or a subway car
+
+    Knows where it was at one time (t, lat, lon) and where it ought to be
+    at another time (pred_t, pred_lat, pred_lon)
+
+    We keep a lot of these around in vehicle_cache, so no per-instance
+    __dict__.
+    """
+
+    __slots__ = ("t", "lat", "lon", "pred_t", "pred_lat", "pred_lon",
+                 "id", "heading", "dirTag", "upcoming_stops", "type")
+
+    def __init__(self, t, lat, lon, id, dirTag, type, heading=0, preds=None, upcoming_stops=None):
+        """ use either make_subway or make_bus instead """
+
+        self.t = t
+
+        # location at time t
+        self.lat, self.lon = float(lat), float(lon)
+
+        # predicted location at time pred_t
+        if preds is None: # if we don't have predictions yet, just use the current info
+            preds = self.t, self.lat, self.lon
+        self.pred_t, self.pred_lat, self.pred_lon = preds
+
+        self.id = id
+        self.heading = int(heading)
+        self.dirTag = dirTag
+
+        if upcoming_stops is None:
+            upcoming_stops = []
+        self.upcoming_stops = upcoming_stops
+
+        self.type = type
+
+    @staticmethod
+    def make_bus(xml_vehicle, now=None):
+        ga = xml_vehicle.getAttribute
+
+        if now is None:
+            now = time.time()
+
+        return Vehicle(t=now - int(ga("secsSinceReport")),
+                       lat=ga("lat"),
+                       lon=ga("lon"),
+                       id=ga("id"),
+                       dirTag=ga("dirTag"),
+                       heading=ga("heading"),
+                       type="bus")
+
+    @staticmethod
+    def make_subway(trip, line,
+                    wait_i, stop_i, direction_i,
+                    wait_j, stop_j, direction_j,
+                    upcoming):
+        lat, lon = SubStop.get_for(stop_i).loc()
+        pred_lat, pred_lon = SubStop.get_for(stop_j).loc()
+        now = time.time()
+        t = now+wait_i
+        pred_t = now+wait_j
+
+        return Vehicle(t=t, lat=lat, lon=lon,
+                       preds=(pred_t, pred_lat, pred_lon),
+                       id=trip,
+                       dirTag=direction_i,
+                       upcoming_stops=upcoming,
+                       type="subway")
+
+    @property
+    def age(self):
+        return int(time.time() - self.t + .5)
+
+    @property
+    def predAge(self):
+        return int(time.time() - self.pred_t + .5)
+
+    @property
+    def round_heading(self):
+        """ heading needs to be divisible by 3 in order to use the
+        current bus icons we're using
+        """
+        return (int(int(self.heading)/3)*3)
+
+    def time_to_min(self, t, now=None):
+        """ convert a time to a number of minutes in the future """
+        if now is None:
+            now = time.time()
+        if t-now < 0:
+            return -1
+        return int((t-now)/60)
+
+    def sendable(self, upcoming=False, now=None):
+        """ a dictionary representing this bus
+        
+        if upcoming, include stop predictions
+        """
+
+        if now is None:
+            now = time.time()
+
+        tr = {
+            "lat_i": self.pred_lat,
+            "lon_i": self.pred_lon,
+            "lat_j": self.lat,
+            "lon_j": self.lon,
+            "id": self.id,
+            "dir": self.dirTag,
+            "age_i": int(now - self.pred_t + .5),
+            "age_j": int(now - self.t + .5),
+            "rhead": self.round_heading,
+            }
+
+        if upcoming:
+            tr["up"] = {}
+
+            if self.type == "bus":
+
+                prev = -100
+                for (t,s,d) in sorted(self.upcoming_stops):
+                    nt = self.time_to_min(t, now)
+
+                    # don't predict the past
+                    if nt < 0:
+                        continue                    
+
+                    # predictions for when the bus turns around or
+                    # otherwise changes route shouldn't be displayed
+                    if d != self.dirTag:
+                        break                
+
+                    if (nt < 200 # we only have icons for the next 200 min
+                        and
+                        nt-prev >= 2 # don't show bus stops closer together than 2min
+                        ):
+
+                        tr["up"][s] = nt #, int(t-time.time())
+                        prev = nt
+
+            else: # subway
+                for t,s in self.upcoming_stops:
+                    if t > 0:
+                        tr["up"][s] = int(t/60)
+
+        return tr
+
+    @staticmethod
+    def sendable_all(vehicles):
+        """ sendable() for many vehicles at once, all aged from the same now """
+
+        now = time.time()
+        return [vehicle.sendable(now=now) for vehicle in vehicles]
+
+
+class SubStop(object):
+    """ a subway stop. """
+
+
+    def __init__(self, strstop):
+        self.route, self.stop,_,_,_,_,_,self.branch,_,_,_,self.stop_desc,_,self.lat,self.lon = strstop.strip().split(',')
+        self.lat, self.lon = float(self.lat), float(self.lon)
+
+    @staticmethod
+    def get_for(stop):
+        """ get the SubStop object for a stop """
+
+        subpaths = request_subpaths()
+        for route, substops in subpaths.items():
+            for substop in substops:
+                if substop.stop == stop:
+                    return substop
+        raise InvalidStopException("unknown stop %s" % stop)
+
+    def arrivals(self):
+        """
+        Determine all predicted arrivals here.
+        
+        Returns [(wait (4: in minutes),
+                  route (Red Line),
+                  headsign (stop description of trips's last stop: Ashmont / Braintree)), ...]
+        
+        Sorted, with earlier arrivals sooner in the list.      
+        """
+
+        trips = []
+
+        for trip, stop_info in request_subways_literal(self.route).items():
+            for wait, stop, direction in stop_info:
+                if wait < 0:
+                    continue
+
+                if stop == self.stop:
+                    _, last_stop, _ = stop_info[-1]
+                    headsign = SubStop.get_for(last_stop).stop_desc.replace(" Station","")
+                    trips.append((wait/60, self.route + " Line", headsign))
+
+        return trips
+
+    def loc(self):
+        return self.lat, self.lon
+
+    def ashmont_stop(self):
+        return self.branch == "Ashmont"
+
+
+
+
+def request_subpaths(routes_cache={}):
+    """ like request_paths but for subways, all routes at once (cached forever) """
+
+    if not routes_cache:
+        for x in get_text(SUBWAY_KEY,refresh=60*60*12)[0].split("\n"):
+            if x.startswith("Line,"):
+                continue
+            try:
+                substop = SubStop(x)
+            except ValueError:
+                continue
+
+            if substop.route not in routes_cache:
+                routes_cache[substop.route] = []
+
+            routes_cache[substop.route].append(substop)
+
+    return routes_cache
+
+def subway_directions(route):
+    """ direction -> [substop, ...] for a subway line, -1 being every
+    stop on it; the Red line's branches make directions 0 (Braintree)
+    and 1 (Ashmont) """
+
+    substops = request_subpaths()[route]
+
+    def branch_in_route(branch, direction):
+        if direction == -1:
+            return True
+
+        if branch == "Ashmont":
+            return direction == 1
+        elif branch == "Braintree":
+            return direction == 0
+        return True
+
+    directions = [-1,0]
+    if route == "Red":
+        directions.append(1)
+
+    return dict((direction, [substop for substop in substops
+                             if branch_in_route(substop.branch, direction)])
+                for direction in directions)
+
+
+
+# route -> (directions, stops), filled in once per instance
+path_cache = {}
+
+def route_config_url(route_num):
+    return BUS_FEED + "&".join(("command=routeConfig",
+                                "a=mbta",
+                                "r=%s" % route_num
+                                ))
+
+def load_paths(route_nums, path_cache=path_cache):
+    """ put the routes that aren't in path_cache yet into it, looking
+    their routeConfigs up in the cache together """
+
+    missing = [route_num for route_num in route_nums if route_num not in path_cache]
+    if not missing:
+        return
+
+    use_urls = dict((route_num, route_config_url(route_num)) for route_num in missing)
+    xmldocs = get_xmls(use_urls.values())
+
+    for route_num in missing:
+        use_url = use_urls[route_num]
+        if use_url not in xmldocs:
+            logging.warning('request_paths: failed url: %s' % use_url)
+            continue
+        xmldoc, doc_age = xmldocs[use_url]
+
+        stops = {}
+
+        xml_routes = xmldoc.getElementsByTagName("route")
+        if not xml_routes:
+            logging.warning('request_paths: system returned no route for %s\n' % route_num)
+            continue
+
+        for s in xml_routes[0].getElementsByTagName("stop"):
+            stop = Stop(s)
+            if stop.lat and stop.tag not in stops:
+                stops[stop.tag] = stop
+
+        directions = {}
+        for d in xmldoc.getElementsByTagName("direction"):
+            direction = Direction(d, stops)
+            directions[direction.tag] = direction
+
+        path_cache[route_num] = directions, stops
+
+def request_paths(route_num, path_cache=path_cache):
+    # path cache shared between calls
+    # never updates path cache
+    # returns: directions, stops
+
+    load_paths([route_num], path_cache)
+    if route_num not in path_cache:
+        return {}, {}
+
+    return path_cache[route_num]
+
+def distance(x1,y1,x2,y2):
+    """ technically, euclidian distance is wrong when used on lat/lon.
+    For an area as small as the boston area it should be pretty good,
+    though """
+
+    return (x1-x2)*(x1-x2) + (y1-y2)*(y1-y2)
+
+@stats.spanned
+def request_predictions(route_num, bus_hash):
+    directions, stops = request_paths(route_num)
+
+    table = predictions.PredictionTable(stops, bus_hash)
+    refresh = schedule.scheduler.prediction_refresh(route_num)
+
+    def predictions_url(stop_list):
+        use_url = BUS_FEED + "&".join(("command=predictionsForMultiStops", "a=mbta", ))
+        for stop in stop_list:
+            use_url += "&stops=%s|%s" % (route_num, stop.tag)
+        return use_url
+
+    # submit stops only N at a time
+    # prevents urls from getting too long
+    use_urls = []
+    cur_stops = []
+    for stop in stops.values():
+        if len(cur_stops) > 50:
+            use_urls.append(predictions_url(cur_stops))
+            cur_stops = []
+        cur_stops.append(stop)
+    if cur_stops:
+        use_urls.append(predictions_url(cur_stops))
+    chunks = len(use_urls)
+
+    # all the chunks from the cache at once
+    xmldocs = get_xmls(use_urls, refresh=refresh)
+    for use_url in use_urls:
+        if use_url not in xmldocs:
+            logging.warning('request_predictions: failed url: %s' % use_url)
+            continue
+        xmldoc, doc_age = xmldocs[use_url]
+        table.add(xmldoc, doc_age)
+
+    schedule.scheduler.prediction_chunks(route_num, chunks)
+
+    # bus_id -> best_time, bus_id -> [(stop_id, time)]
+    return table.best(), table.full
+
+
+def vehicles_url(route_num):
+    return BUS_FEED + "&".join(("command=vehicleLocations",
+                                "a=mbta",
+                                "r=%s" % route_num,
+                                #"t=%s" % int(time.time())
+                                "t=0"
+                                ))
+
+def request_buses(route_num):
+    return request_buses_multi([route_num])[route_num]
+
+@stats.spanned
+def request_buses_multi(route_nums):
+    """ route -> bus_hash for several routes, looked up in the cache
+    together """
+
+    use_urls = dict((route_num, vehicles_url(route_num)) for route_num in route_nums)
+
+    refresh = dict((use_urls[route_num], schedule.scheduler.vehicle_refresh(route_num))
+                   for route_num in route_nums)
+    xmldocs = get_xmls(use_urls.values(), refresh=refresh)
+
+    now = time.time()
+    buses = {}
+    for route_num in route_nums:
+        bus_hash = {}
+        buses[route_num] = bus_hash
+
+        use_url = use_urls[route_num]
+        if use_url not in xmldocs:
+            logging.warning('request_buses: failed url: %s' % use_url)
+            continue
+        xmldoc, doc_age = xmldocs[use_url]
+
+        for vehicle in xmldoc.getElementsByTagName("vehicle"):
+            bus = Vehicle.make_bus(vehicle, now)
+            bus_hash[bus.id] = bus
+
+        schedule.scheduler.vehicles(route_num, len(bus_hash))
+
+    return buses
+
+
+@stats.spanned
+def update_predictions(route_num, bus_hash):
+    def to_time(secs):
+        return int(time.time()+secs)
+
+    vehicle_predictions, full_vehicle_predictions = request_predictions(route_num, bus_hash)
+    for bus_id, prediction in vehicle_predictions.items():
+        secs, stop_lat, stop_lon = prediction
+        bus_hash[bus_id].pred_t = to_time(secs)
+        bus_hash[bus_id].pred_lat = stop_lat
+        bus_hash[bus_id].pred_lon = stop_lon
+        bus_hash[bus_id].upcoming_stops = [(to_time(secs), s, dt) 
+                                           for (s, dt, secs) 
+                                           in full_vehicle_predictions[bus_id]]
+
+
+def allRoutes():
+    use_url = BUS_FEED + "&".join(("command=routeList",
+                                       "a=mbta"))
+
+    try:
+        xmldoc, doc_age = get_xml(use_url)
+    except FailedFetchException:
+        logging.warning('allRoutes: failed url: %s' % use_url)
+        return []
+
+
+    allr = []
+    allr.extend([("Red", "Red Line"),
+                 ("Orange","Orange Line"),
+                 ("Blue","Blue Line")])
+
+    allr.extend([[route.getAttribute("tag"), route.getAttribute("title")]
+                 for route in xmldoc.getElementsByTagName("route")])
+    return allr
+
+class Point(object):
+    def __init__(self, xml_point):
+        self.lat = float(xml_point.getAttribute("lat"))
+        self.lon = float(xml_point.getAttribute("lon"))
+    def __repr__(self):
+        return "(%s, %s)" % (self.lat, self.lon)
+
+class Path(object):
+    def __init__(self, xml_path):
+        self.points = [Point(p) for p in xml_path.getElementsByTagName("point")]
+        self.tags = [tag.getAttribute("id") for tag in xml_path.getElementsByTagName("tag")]
+
+    def __getitem__(self, x):
+        return self.points[x]
+
+class Stop(object):
+    def __init__(self, xml_stop):
+        for attribute in ("tag", "title", "dirTag", "lat", "lon"):
+            setattr(self, attribute, xml_stop.getAttribute(attribute))
+        if self.lat:
+            self.lat = float(self.lat)
+        if self.lon:
+            self.lon = float(self.lon)
+
+
+class Direction(object):
+    def __init__(self, xml_direction, stops):
+        for attribute in ("tag", "title", "name"):
+            setattr(self, attribute, xml_direction.getAttribute(attribute))
+
+        self.stops = [stops[s.getAttribute("tag")]
+                      for s in xml_direction.getElementsByTagName("stop")]
+
+        # distance along this direction, for snapping and ordering
+        self.index = geometry.SegmentIndex([(stop.lat, stop.lon) for stop in self.stops])
+
+    @property
+    def along(self):
+        """ meters from the first stop to each stop, in stop order """
+        return self.index.along
+
+    def project(self, lat, lon, max_meters=None):
+        """ (segment, meters along this direction) of the closest point
+        to lat, lon, or None if it's further than max_meters away.
+        Segment n runs from self.stops[n] to self.stops[n+1]. """
+
+        p = self.index.project(lat, lon, max_meters)
+        if p is None:
+            return None
+        segment, u, along, away = p
+        return segment, along
+
+    def along_of(self, lat, lon, max_meters=geometry.MAX_SNAP_METERS):
+        return self.index.along_of(lat, lon, max_meters)
+
+@stats.spanned
+def request_subways_literal(line):
+    """ request current subway info, don't do much processing """
+
+    tz_boston = dateutil.tz.tzstr('EST5EDT')
+
+    use_url = SUBWAY_FEED_DIR + line + ".txt"
+
+    refresh = max(schedule.SUBWAY_MIN, schedule.scheduler.vehicle_refresh(line))
+    try:
+        text = get_text(use_url,refresh=refresh)[0]
+    except FailedFetchException:
+        logging.warning('request_subways: failed url: %s' % use_url)
+        return {}
+
+    trips = {}
+    for x in text.split("\n"):
+        try:
+            _, n, stop, source, date, t, ampm, wait, rev, direction = x.replace(",","").split()
+        except ValueError:
+            sys.stderr.write(x+"\n")
+            continue
+
+        if rev != "Revenue":
+            continue
+
+        def to_sec(t,ampm):
+            t_hr, t_min, t_sec = t.split(':')
+            if t_hr == "12":
+                if ampm == "AM":
+                    t_hr = "0"
+            elif ampm=="PM":
+                t_hr = int(t_hr)+12
+            t = int(t_hr)*60*60+int(t_min)*60+int(t_sec)
+            return t
+
+        t_then = to_sec(t,ampm)
+        now = datetime.datetime.now(tz_boston)
+        now_local = now.strftime("%H:%M:%S")
+        t_now = to_sec(now_local, "NA")
+
+        #if (now.month > 3 or (now.month == 3 and now.day >= 2)) and now.month < 11:
+        #    # DST
+        #    t_now += 60*60
+        
+        t_now += 60*60 # DST
+
+        if n not in trips:
+            trips[n] = []
+
+        wait = t_then - t_now
+
+        #logging.info("t_then: %s; t_now: %s; t: %s; wait: %s, now_local: %s" % (t_then, t_now, t, wait, now_local))
+
+        trips[n].append((wait, stop, direction))
+
+    for trip, stop_info in trips.items():
+        stop_info.sort()
+
+        while len(stop_info) > 2 and stop_info[1][0] < 0:
+            del stop_info[0] # only have one negative wait at a time
+
+    return trips
+
+def visited_ashmont_stop(stop_info):
+    for wait, stop, direction in stop_info:
+        if SubStop.get_for(stop).ashmont_stop():
+            return True
+    return False
+
+def request_subways(route):
+    subways = {}
+    for trip, stop_info in request_subways_literal(route).items():
+        if not stop_info:
+            continue
+
+        wait_j,stop_j,direction_j = stop_info[0]
+
+        if len(stop_info) > 1:
+            wait_i,stop_i,direction_i = stop_info[1]
+        else:
+            wait_i,stop_i,direction_i = stop_info[0]
+
+        # the direction/branch flag is often set wrong on trains
+        if route == "Red":
+            if visited_ashmont_stop(stop_info):
+                direction_i = direction_i = "1" # mark as ashmont line
+            else:
+                direction_i = direction_i = "0" # mark as braintree
+
+        subways[trip] = Vehicle.make_subway(trip, route,
+                                            wait_i, stop_i, direction_i,
+                                            wait_j, stop_j, direction_j,
+                                            [(wait_n, stop_n) for (wait_n, stop_n, dir_n) in stop_info])
+
+    schedule.scheduler.vehicles(route, len(subways))
+    return subways
+
+
+# route -> (when we refreshed it, {vehicle id: Vehicle})
+vehicle_cache = {}
+
+def cached_vehicles(route):
+    """ {vehicle id: Vehicle} for /route/ as of its last refresh """
+
+    try:
+        timestamp, vehicles = vehicle_cache[route]
+        return vehicles
+    except KeyError:
+        return {}
+
+def refresh_vehicles(routes):
+    """ refresh vehicle_cache for the routes that are due, as often as
+    schedule says; subway caching is done in get_text """
+
+    now = time.time()
+    stale = [route for route in routes
+             if is_subway(route) or route not in vehicle_cache
+             or now - vehicle_cache[route][0] > schedule.scheduler.vehicle_refresh(route)]
+
+    bus_routes = [route for route in stale if not is_subway(route)]
+    if bus_routes:
+        for route, buses in request_buses_multi(bus_routes).items():
+            vehicle_cache[route] = now, buses
+            update_predictions(route, buses)
+
+    for route in stale:
+        if is_subway(route):
+            vehicle_cache[route] = now, request_subways(route)
+
+
+def snap_sendables(route_num, sendables):
+    """ add how far along its direction's path each bus is, in meters,
+    for where it was (along_j) and where it's predicted to be (along_i).
+    With these the client only has to interpolate in one dimension.
+
+    Buses too far from their path to snap are left alone.
+    """
+
+    directions, stops = request_paths(route_num)
+    for bus in sendables:
+        direction = directions.get(bus["dir"])
+        if direction is None:
+            continue
+
+        along_i = direction.along_of(bus["lat_i"], bus["lon_i"])
+        along_j = direction.along_of(bus["lat_j"], bus["lon_j"])
+        if along_i is None or along_j is None:
+            continue
+
+        bus["along_i"] = int(along_i)
+        bus["along_j"] = int(along_j)
+
+    return sendables
+
+
+def stops_near(north, east, south, west):
+    """ route_table rows that might be in the box, using route_index to
+    skip the ones that can't be.  If route_index is missing or was built
+    for a different route_table, that's all of them.
+    """
+
+    table = route_table.table
+    if route_index is None or route_index.rows != len(table):
+        return table
+
+    cells = route_index.cells
+    cell_size = route_index.cell_size
+    try:
+        lat_cells = range(int(math.floor(south/cell_size)), int(math.floor(north/cell_size))+1)
+        lon_cells = range(int(math.floor(west/cell_size)), int(math.floor(east/cell_size))+1)
+    except (OverflowError, ValueError): # infinite or nan bounds
+        return table
+    if not lat_cells or not lon_cells:
+        return []
+
+    if len(lat_cells)*len(lon_cells) > len(cells):
+        # zoomed way out; cheaper to go through the cells we have
+        lat_min, lat_max = lat_cells[0], lat_cells[-1]
+        lon_min, lon_max = lon_cells[0], lon_cells[-1]
+        rows = [n
+                for (lat_cell, lon_cell), cell_rows in cells.items()
+                if lat_min <= lat_cell <= lat_max and lon_min <= lon_cell <= lon_max
+                for n in cell_rows]
+    else:
+        rows = [n
+                for lat_cell in lat_cells
+                for lon_cell in lon_cells
+                for n in cells.get((lat_cell, lon_cell), ())]
+
+    return [table[n] for n in rows]
@@ -0,0 +1,214 @@
+"""
+Distances along route paths.
+
+Everything here works on a flat projection of lat/lon centered on
+Boston.  That's wrong for anywhere else, but for an area as small as
+the boston area it's good to well under a percent.
+"""
+
+import math
+from array import array
+
+BOSTON_LAT = 42.36
+
+METERS_PER_DEG_LAT = 111320.0
+METERS_PER_DEG_LON = METERS_PER_DEG_LAT * math.cos(math.radians(BOSTON_LAT))
+
+# buses further than this from their path don't get snapped to it
+MAX_SNAP_METERS = 300
+
+# side of the square cells segments are bucketed into
+CELL_METERS = 250.0
+
+# paths with fewer segments than this just get scanned
+MIN_BUCKETED_SEGMENTS = 16
+
+
+def to_xy(lat, lon):
+    """ lat/lon to meters on the flat projection """
+    return lon*METERS_PER_DEG_LON, lat*METERS_PER_DEG_LAT
+
+
+class SegmentIndex(object):
+
+    """ The segments of one path, with how far along the path each
+    point is, bucketed by location so finding the closest segment to a
+    point only looks at segments nearby
+
+    points: [(lat, lon), ...] in path order
+    along: along[n] is the distance in meters from points[0] to points[n]
+    cells: (cell x, cell y) -> [segment, ...] for every segment whose
+           bounding box touches that cell
+    """
+
+    def __init__(self, points, cell_meters=CELL_METERS):
+        self.points = list(points)
+        self.xs = array('d')
+        self.ys = array('d')
+        for lat, lon in self.points:
+            x, y = to_xy(lat, lon)
+            self.xs.append(x)
+            self.ys.append(y)
+
+        self.along = array('d')
+        total = 0.0
+        for n in range(len(self.points)):
+            if n:
+                dx, dy = self.xs[n]-self.xs[n-1], self.ys[n]-self.ys[n-1]
+                total += math.sqrt(dx*dx + dy*dy)
+            self.along.append(total)
+
+        self.cell_meters = cell_meters
+        self.cells = {}
+        for n in range(len(self)):
+            cx1, cy1 = self.cell(min(self.xs[n], self.xs[n+1]), min(self.ys[n], self.ys[n+1]))
+            cx2, cy2 = self.cell(max(self.xs[n], self.xs[n+1]), max(self.ys[n], self.ys[n+1]))
+            for cx in range(cx1, cx2+1):
+                for cy in range(cy1, cy2+1):
+                    self.cells.setdefault((cx, cy), []).append(n)
+
+        if self.cells:
+            cxs = [cx for cx, cy in self.cells]
+            cys = [cy for cx, cy in self.cells]
+            self.bounds = min(cxs), min(cys), max(cxs), max(cys)
+        else:
+            self.bounds = None
+
+    def __len__(self):
+        """ number of segments """
+        return max(len(self.points) - 1, 0)
+
+    @property
+    def length(self):
+        if not self.along:
+            return 0.0
+        return self.along[-1]
+
+    def cell(self, x, y):
+        return int(math.floor(x/self.cell_meters)), int(math.floor(y/self.cell_meters))
+
+    def project_segment(self, n, x, y):
+        """ closest point to (x, y) on segment n
+
+        returns (u, squared distance) where u in [0, 1] is how far along
+        the segment the closest point is
+        """
+
+        x1, y1 = self.xs[n], self.ys[n]
+        dx, dy = self.xs[n+1]-x1, self.ys[n+1]-y1
+        seg_sq = dx*dx + dy*dy
+
+        if seg_sq == 0:
+            u = 0.0
+        else:
+            u = ((x-x1)*dx + (y-y1)*dy) / seg_sq
+            if u < 0:
+                u = 0.0
+            elif u > 1:
+                u = 1.0
+
+        px, py = x1 + u*dx, y1 + u*dy
+        return u, (x-px)*(x-px) + (y-py)*(y-py)
+
+    def closest_linear(self, x, y):
+        """ (segment, u, squared distance) checking every segment """
+
+        best = None
+        for n in range(len(self)):
+            u, d = self.project_segment(n, x, y)
+            if best is None or d < best[2]:
+                best = n, u, d
+        return best
+
+    def closest_bucketed(self, x, y, max_meters=None):
+        """ (segment, u, squared distance) checking cells in rings
+        around the one (x, y) is in, stopping once no unchecked segment
+        could be closer, or scanning every segment when (x, y) is so far
+        away that the rings are mostly empty.  None if nothing is within
+        max_meters.
+        """
+
+        qx, qy = self.cell(x, y)
+        min_cx, min_cy, max_cx, max_cy = self.bounds
+        last_ring = max(qx-min_cx, max_cx-qx, qy-min_cy, max_cy-qy)
+
+        # nothing can be closer than the cells between here and the grid
+        outside = max(min_cx-qx, qx-max_cx, min_cy-qy, qy-max_cy, 0)
+        if max_meters is not None and (outside-1)*self.cell_meters > max_meters:
+            return None
+
+        best = None
+        seen = set()
+        checked = 0 # cells looked in
+        ring = 0
+        while ring <= last_ring:
+            if checked > len(self.cells):
+                # far from the path the rings are mostly empty cells, and
+                # each costs more than looking at every segment
+                best = self.closest_linear(x, y)
+                break
+
+            if ring == 0:
+                ring_cells = [(qx, qy)]
+            else:
+                ring_cells = [(cx, cy)
+                              for cx in range(qx-ring, qx+ring+1)
+                              for cy in (qy-ring, qy+ring)]
+                ring_cells.extend([(cx, cy)
+                                   for cx in (qx-ring, qx+ring)
+                                   for cy in range(qy-ring+1, qy+ring)])
+
+            checked += len(ring_cells)
+            for c in ring_cells:
+                for n in self.cells.get(c, ()):
+                    if n in seen:
+                        continue
+                    seen.add(n)
+                    u, d = self.project_segment(n, x, y)
+                    if best is None or d < best[2]:
+                        best = n, u, d
+
+            # anything we haven't seen is in a cell at least this far away
+            reach = ring*self.cell_meters
+            if best is not None and best[2] <= reach*reach:
+                break
+            if max_meters is not None and reach > max_meters:
+                break
+            ring += 1
+
+        if best is not None and max_meters is not None and best[2] > max_meters*max_meters:
+            return None
+        return best
+
+    def project(self, lat, lon, max_meters=None):
+        """ where on the path is closest to lat, lon
+
+        returns (segment, u, along, meters away), or None for a path
+        with no segments or if the path is more than max_meters away
+        """
+
+        if not len(self):
+            return None
+
+        x, y = to_xy(lat, lon)
+        if len(self) < MIN_BUCKETED_SEGMENTS:
+            best = self.closest_linear(x, y)
+            if max_meters is not None and best[2] > max_meters*max_meters:
+                return None
+        else:
+            best = self.closest_bucketed(x, y, max_meters)
+            if best is None:
+                return None
+
+        n, u, d = best
+        along = self.along[n] + u*(self.along[n+1] - self.along[n])
+        return n, u, along, math.sqrt(d)
+
+    def along_of(self, lat, lon, max_meters=MAX_SNAP_METERS):
+        """ distance along the path to the closest point to lat, lon,
+        or None if the path is more than max_meters away """
+
+        p = self.project(lat, lon, max_meters)
+        if p is None:
+            return None
+        return p[2]
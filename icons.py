@@ -0,0 +1,201 @@
+"""
+Heading arrows and minute badges drawn on request, for /icon
+
+   render(params) -> png bytes
+
+params come from the query string:
+
+   heading   degrees, the arrow points this way (default 0)
+   min       draw an "n min" badge instead of an arrow
+   color     rrggbb (default 0000ff for arrows, 000000 for badges)
+   size      arrow size in css pixels, 8-64 (default 16); not for badges
+   scale     device pixels per css pixel, 1-4 (default 1)
+
+An arrow can be at most 64 device pixels across (size*scale).  Every
+color, heading, size and scale is a different icon to draw, and without
+numpy bigger ones take long enough that someone asking for lots of them
+could keep an instance busy.
+
+Arrows are mkicons' triangles, so at the defaults they're the icons in
+static.  Static files aren't readable from the app, so badges use the
+little bitmap font below rather than minute_image.py's pngs.
+
+Rendered icons are kept in an LRU in the instance and in memcache.
+"""
+
+import cStringIO
+
+import png
+import mkicons
+
+MIN_SIZE, MAX_SIZE = 8, 64
+MAX_SCALE = 4
+MAX_PIXELS = 64 # size*scale
+MAX_MINUTES = 999
+
+ARROW_COLOR = "0000ff"
+BADGE_COLOR = "000000"
+
+# icons kept in each instance
+LRU_ITEMS = 500
+
+# bump to make clients and memcache forget icons drawn the old way
+VERSION = 1
+
+GLYPHS = {
+    "0": (" ### ", "#   #", "#  ##", "# # #", "##  #", "#   #", " ### "),
+    "1": ("  #  ", " ##  ", "  #  ", "  #  ", "  #  ", "  #  ", " ### "),
+    "2": (" ### ", "#   #", "    #", "   # ", "  #  ", " #   ", "#####"),
+    "3": ("#####", "   # ", "  #  ", "   # ", "    #", "#   #", " ### "),
+    "4": ("   # ", "  ## ", " # # ", "#  # ", "#####", "   # ", "   # "),
+    "5": ("#####", "#    ", "#### ", "    #", "    #", "#   #", " ### "),
+    "6": ("  ## ", " #   ", "#    ", "#### ", "#   #", "#   #", " ### "),
+    "7": ("#####", "    #", "   # ", "  #  ", " #   ", " #   ", " #   "),
+    "8": (" ### ", "#   #", "#   #", " ### ", "#   #", "#   #", " ### "),
+    "9": (" ### ", "#   #", "#   #", " ####", "    #", "   # ", " ##  "),
+    "m": ("     ", "     ", "## # ", "# # #", "# # #", "#   #", "#   #"),
+    "i": ("  #  ", "     ", " ##  ", "  #  ", "  #  ", "  #  ", " ### "),
+    "n": ("     ", "     ", "# ## ", "##  #", "#   #", "#   #", "#   #"),
+    " ": ("   ",) * 7,
+    }
+GLYPH_HEIGHT = 7
+
+
+class BadParams(ValueError):
+    pass
+
+
+class LRU(object):
+
+    """ a dict that forgets what was used longest ago past max_items """
+
+    def __init__(self, max_items=LRU_ITEMS):
+        self.max_items = max_items
+        self.values = {}
+        self.used = {} # key -> tick
+        self.tick = 0
+
+    def get(self, key):
+        if key not in self.values:
+            return None
+        self.tick += 1
+        self.used[key] = self.tick
+        return self.values[key]
+
+    def set(self, key, value):
+        if key not in self.values and len(self.values) >= self.max_items:
+            oldest = min(self.used, key=self.used.get)
+            del self.values[oldest]
+            del self.used[oldest]
+        self.tick += 1
+        self.values[key] = value
+        self.used[key] = self.tick
+
+    def __len__(self):
+        return len(self.values)
+
+lru = LRU()
+
+
+def int_param(params, name, default, low, high):
+    value = params.get(name) or default
+    try:
+        value = int(value)
+    except ValueError:
+        raise BadParams("%s should be a number: %s" % (name, value))
+    if not low <= value <= high:
+        raise BadParams("%s should be %s to %s" % (name, low, high))
+    return value
+
+def normalize(params):
+    """ the icon asked for, as a tuple that's also its cache key """
+
+    scale = int_param(params, "scale", 1, 1, MAX_SCALE)
+    if params.get("min"):
+        if params.get("size"):
+            raise BadParams("size is only for arrows")
+        minutes = int_param(params, "min", 0, 0, MAX_MINUTES)
+        color = params.get("color") or BADGE_COLOR
+        shape = ("min", minutes)
+    else:
+        heading = int_param(params, "heading", 0, -360, 720) % 360
+        size = int_param(params, "size", mkicons.size, MIN_SIZE, MAX_SIZE)
+        if size*scale > MAX_PIXELS:
+            raise BadParams("size*scale should be at most %s" % MAX_PIXELS)
+        color = params.get("color") or ARROW_COLOR
+        shape = ("heading", heading, size)
+
+    try:
+        color = mkicons.parse_color(color)
+    except ValueError, e:
+        raise BadParams(str(e))
+    return (VERSION,) + shape + (color, scale)
+
+def arrow(heading, size, color, scale):
+    """ (width, height, rows) """
+
+    pixels = size*scale
+    covered = mkicons.coverage([heading], pixels, mkicons.scale)[heading]
+    return pixels, pixels, list(mkicons.rgba_rows(covered, color, mkicons.ALPHA))
+
+def badge(minutes, color, scale):
+    """ (width, height, rows): "n min" with a pixel of space around it """
+
+    text = "%s min" % minutes
+    columns = []
+    for c in text:
+        glyph = GLYPHS[c]
+        for x in range(len(glyph[0])):
+            columns.append([row[x] != " " for row in glyph])
+        columns.append([False]*GLYPH_HEIGHT)
+    columns = [[False]*GLYPH_HEIGHT] + columns
+
+    r, g, b = color
+    on = (r, g, b, 255)
+    off = (0, 0, 0, 0)
+    width = len(columns)*scale
+    blank = list(off)*width
+
+    rows = [blank]*scale
+    for y in range(GLYPH_HEIGHT):
+        row = []
+        for column in columns:
+            row.extend((column[y] and on or off)*scale)
+        rows.extend([row]*scale)
+    rows.extend([blank]*scale)
+    return width, len(rows), rows
+
+def draw(key):
+    """ png bytes for a normalized key """
+
+    shape = key[1:-2]
+    color, scale = key[-2:]
+    if shape[0] == "min":
+        width, height, rows = badge(shape[1], color, scale)
+    else:
+        width, height, rows = arrow(shape[1], shape[2], color, scale)
+
+    out = cStringIO.StringIO()
+    png.Writer(width=width, height=height, alpha=True, filter_type=0).write(out, rows)
+    return out.getvalue()
+
+def cache_key(key):
+    return "icon:" + ":".join(map(str, key))
+
+def render(params, cache=None):
+    """ png bytes for the icon params ask for, from the LRU, then /cache/
+    (a backend), then drawn; raises BadParams """
+
+    key = normalize(params)
+    data = lru.get(key)
+    if data is not None:
+        return data
+
+    if cache is not None:
+        data = cache.get(cache_key(key))
+    if data is None:
+        data = draw(key)
+        if cache is not None:
+            cache.set(cache_key(key), data)
+    lru.set(key, data)
+    return data
@@ -0,0 +1,49 @@
+"""
+The fastest json we have
+
+   from json_impl import json
+   json.dumps(...)
+
+simplejson is bundled because the app engine runtime app.yaml deploys
+on, python 2.5, has no json module.  Without its C speedups, which
+mkspeedups.py builds and app engine won't load, every dumps goes
+through simplejson's pure python encoder.  So we take, in order:
+
+   simplejson, if its speedups loaded
+   the standard library's json, if it has its C encoder (python 2.6+)
+   simplejson, pure python
+
+In production that is still the last one, as it always was: the first
+two are for running locally, on 2.6 or later or with the speedups
+built, until we move to a newer runtime.
+
+/active/ says which we got, and /pure/ whether it's the slow one;
+mbtaplot logs it when an instance starts and /stats shows it.
+"""
+
+import simplejson
+
+try:
+    import json as stdlib_json
+except ImportError:
+    stdlib_json = None
+
+def speedups(module):
+    """ does /module/ (simplejson or json) encode in C? """
+
+    return getattr(module.encoder, "c_make_encoder", None) is not None
+
+if speedups(simplejson):
+    json = simplejson
+    active = "simplejson %s with C speedups" % simplejson.__version__
+elif stdlib_json is not None and speedups(stdlib_json):
+    json = stdlib_json
+    active = "json %s (standard library) with C encoder" % stdlib_json.__version__
+else:
+    json = simplejson
+    active = "simplejson %s, pure python" % simplejson.__version__
+
+pure = not speedups(json)
+
+if __name__ == "__main__":
+    print active
@@ -0,0 +1,85 @@
+"""
+json for Buses and Paths answers, written straight out
+
+   jsonwriter.write_vehicles(self.response.out, sendables)
+   jsonwriter.write_routes(self.response.out, {route: sendables})
+   jsonwriter.write_paths(out, directions, stops)
+
+Buses and Paths answers always have the same shape, so rather than hand
+dicts to the json encoder, which works out what every value is, each
+vehicle, point and stop is one % template: ints with %d, strings escaped
+by the encoder's own encode_basestring_ascii, and latitudes and
+longitudes to six places, about 10cm.  That's finer than any feed is
+accurate to, and two or three times quicker than the shortest repr json
+writes floats with, which was most of the time the C encoders took.
+
+Apart from those last digits, what comes out parses to the same thing
+json.dumps would have made.  A sendable with any other keys (with
+upcoming stops, say) goes through json.dumps.
+"""
+
+from json_impl import json
+
+encode = json.encoder.encode_basestring_ascii
+
+# Vehicle.sendable(), and after snap_sendables
+VEHICLE = ('{"lat_i": %.6f, "lon_i": %.6f, "lat_j": %.6f, "lon_j": %.6f, "id": %s, '
+           '"dir": %s, "age_i": %d, "age_j": %d, "rhead": %d}')
+SNAPPED_VEHICLE = VEHICLE[:-1] + ', "along_i": %d, "along_j": %d}'
+VEHICLE_KEYS = 9
+SNAPPED_KEYS = VEHICLE_KEYS + 2
+
+POINT = '{"lat": %.6f, "lon": %.6f}'
+STOP = '{"lat": %.6f, "lon": %.6f, "title": %s, "tag": %s}'
+
+def vehicle(s):
+    """ json for one sendable """
+
+    if len(s) == VEHICLE_KEYS:
+        return VEHICLE % (s["lat_i"], s["lon_i"], s["lat_j"], s["lon_j"],
+                          encode(s["id"]), encode(s["dir"]),
+                          s["age_i"], s["age_j"], s["rhead"])
+    if len(s) == SNAPPED_KEYS and "along_j" in s:
+        return SNAPPED_VEHICLE % (s["lat_i"], s["lon_i"], s["lat_j"], s["lon_j"],
+                                  encode(s["id"]), encode(s["dir"]),
+                                  s["age_i"], s["age_j"], s["rhead"],
+                                  s["along_i"], s["along_j"])
+    return json.dumps(s)
+
+def write_vehicles(out, sendables):
+    """ a Buses answer: [sendable, ...] """
+
+    out.write("[%s]" % ", ".join([vehicle(s) for s in sendables]))
+
+def write_routes(out, answer):
+    """ a Buses?routes= answer: {route: [sendable, ...]} """
+
+    write = out.write
+    write("{")
+    for n, (route, sendables) in enumerate(answer.items()):
+        if n:
+            write(", ")
+        write("%s: " % encode(route))
+        write_vehicles(out, sendables)
+    write("}")
+
+def write_paths(out, directions, stops):
+    """ a Paths answer for a bus route, from request_paths:
+
+       {"directions": {tag: [[{"lat": lat, "lon": lon}, ...]]},
+        "along": {tag: [meters, ...]},
+        "stops": [{"lat": lat, "lon": lon, "title": title, "tag": tag}, ...]}
+    """
+
+    write = out.write
+    write('{"directions": {')
+    write(", ".join(["%s: [[%s]]" % (encode(d.tag), ", ".join([POINT % (stop.lat, stop.lon)
+                                                                for stop in d.stops]))
+                     for d in directions.values()]))
+    write('}, "along": {')
+    write(", ".join(["%s: [%s]" % (encode(d.tag), ", ".join(["%d" % along for along in d.along]))
+                     for d in directions.values()]))
+    write('}, "stops": [')
+    write(", ".join([STOP % (stop.lat, stop.lon, encode(stop.title), encode(stop.tag))
+                     for stop in stops.values()]))
+    write("]}")
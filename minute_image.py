@@ -1,5 +1,7 @@
 """
 Little script to generate files that say 'n min' for each minute
+
+Run mksprites.py after to pack them into static/minutes.png.
 """
 
 
@@ -1,91 +1,182 @@
 """
 This script made the slightly non equilateral icons that are in static
+
+   python mkicons.py [options]
+
+   --size N      icons are N pixels on a side (default 16)
+   --samples N   N x N samples per pixel (default 3)
+   --color HEX   rrggbb (default 0000ff)
+   --alpha N     opacity of a fully covered pixel, 0-255 (default 160)
+   --step N      degrees between headings (default 3)
+   --out DIR     where to write dir_<deg>.png (default: here)
+
+Run mksprites.py after to pack them into static/headings.png.
+
+Coverage for every heading is worked out at once, with numpy when it's
+available and one heading at a time otherwise.  The defaults make the
+icons that are in static, exactly.
 """
 
-import sys, png
+import os
+import sys
 import math
+import optparse
+from array import array
+import png
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 scale=3
 size=16
 
-def get_img(i):
-    def to_rad(deg):
-        return deg*math.pi/180
-    max_x, max_y = size*scale, size*scale
-    x_off = y_off = size/2*scale
-    hyp = float(x_off)-1.0
+COLOR = (0, 0, 255)
+ALPHA = 160
 
-    def get_point(theta):
-        return x_off+math.sin(theta)*hyp, y_off-math.cos(theta)*hyp
+# headings whose samples numpy works on at once, to bound memory
+NUMPY_BATCH = 16
 
-    nose = get_point(to_rad(i))
-    legA = get_point(to_rad(i+128))
-    legB = get_point(to_rad(i-128+360))
+def to_rad(deg):
+    return deg*math.pi/180
 
-    def dist(ptA,ptB):
-        x1,y1 = ptA
-        x2,y2 = ptB
-        return math.sqrt( (x1-x2)*(x1-x2) + (y1-y2)*(y1-y2) )
+def triangle(heading, size=size, samples=scale):
+    """ (nose, legA, legB) for a heading, in sample coordinates """
 
-    def cross(ptA, ptB, ptV):
-        x1,y1 = ptA
-        x2,y2 = ptB
-        xV,yV = ptV
+    x_off = y_off = size*samples/2.0
+    hyp = x_off-1.0
 
-        xA, yA = x1-xV, y1-yV
-        xB, yB = x2-xV, y2-yV
-
-        return xA*yB-xB*yA
-
-    def is_left_of(ptQ, ptA, ptB):
-        return cross(ptQ, ptA, ptB) > 0        
+    def get_point(theta):
+        return x_off+math.sin(theta)*hyp, y_off-math.cos(theta)*hyp
 
-    def avg_dist(x,y):
-        return (dist((x,y), nose) + dist((x,y), legA) + dist((x,y), legB)) / 3
+    return (get_point(to_rad(heading)),
+            get_point(to_rad(heading+128)),
+            get_point(to_rad(heading-128+360)))
 
-    center = x_off, y_off
+def sample_offsets(samples):
+    """ where a pixel's samples are, relative to x*samples; -1, 0, 1 for 3 """
 
-    def inside(x,y):
-        pt = x,y
-        return (is_left_of(pt, nose, legA) and
-                is_left_of(pt, legA, legB) and
-                is_left_of(pt, legB, nose))
+    return [m - samples//2 for m in range(samples)]
 
-        #return avg_dist(x,y) < avg_dist(*center)*1.14
+def edges(nose, legA, legB):
+    """ a point is inside if it's left of all of these (A, B) """
 
-    def get_val(x,y):
-        if inside(x,y):
-            return 1.0
-        else:
-            return 0.0
+    return ((nose, legA), (legA, legB), (legB, nose))
 
-    def avg_val(x,y):
-        s = 0
-        for x_move in [-1,0,1]:
-            for y_move in [-1,0,1]:
-                s += get_val(x*3+x_move,y*3+y_move)
-        s = s/9
+def coverage_loop(heading, size=size, samples=scale):
+    """ [[fraction of each pixel inside the triangle]] for one heading """
 
-        assert 0 <= s <= 1, s
+    offsets = sample_offsets(samples)
+    tri_edges = edges(*triangle(heading, size, samples))
+    n_samples = float(samples*samples)
 
-        return 0,0,255,int(160*s)
+    def inside(x, y):
+        for (xA, yA), (xB, yB) in tri_edges:
+            # left of A->B: the cross product of (pt - B) and (A - B)
+            if not (x-xB)*(yA-yB) - (xA-xB)*(y-yB) > 0:
+                return False
+        return True
 
+    rows = []
     for y in range(size):
         row = []
         for x in range(size):
-            r,g,b,a = avg_val(x,y)
-            row.append(r)
-            row.append(g)
-            row.append(b)
-            row.append(a)
-        yield row
-
-def mkicons():
+            s = 0
+            for x_move in offsets:
+                for y_move in offsets:
+                    if inside(x*samples+x_move, y*samples+y_move):
+                        s += 1
+            row.append(s/n_samples)
+        rows.append(row)
+    return rows
+
+def coverage_numpy(headings, size=size, samples=scale):
+    """ headings x size x size array of fractions, same as coverage_loop """
+
+    offsets = numpy.array(sample_offsets(samples), dtype=float)
+    # sample coordinates, grouped by pixel
+    s = (numpy.arange(size, dtype=float)[:,None]*samples + offsets[None,:]).ravel()
+    X = s[None,None,:]
+    Y = s[None,:,None]
+
+    result = numpy.empty((len(headings), size, size))
+    for start in range(0, len(headings), NUMPY_BATCH):
+        batch = headings[start:start+NUMPY_BATCH]
+        corners = numpy.array([triangle(h, size, samples) for h in batch]) # h x 3 x 2
+
+        inside = numpy.ones((len(batch), len(s), len(s)), dtype=bool)
+        for a, b in ((0, 1), (1, 2), (2, 0)):
+            xA = corners[:,a,0][:,None,None]
+            yA = corners[:,a,1][:,None,None]
+            xB = corners[:,b,0][:,None,None]
+            yB = corners[:,b,1][:,None,None]
+            inside &= (X-xB)*(yA-yB) - (xA-xB)*(Y-yB) > 0
+
+        counts = inside.reshape(len(batch), size, samples, size, samples).sum(axis=4).sum(axis=2)
+        result[start:start+len(batch)] = counts/float(samples*samples)
+    return result
+
+def coverage(headings, size=size, samples=scale, use_numpy=None):
+    """ heading -> rows of fractions of each pixel inside the triangle """
+
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    if not use_numpy:
+        return dict((h, coverage_loop(h, size, samples)) for h in headings)
+
+    headings = list(headings)
+    covered = coverage_numpy(headings, size, samples)
+    return dict((h, covered[n]) for n, h in enumerate(headings))
+
+def rgba_rows(covered, color=COLOR, alpha=ALPHA):
+    """ png.Writer rows for a heading's coverage """
+
+    r, g, b = color
+    if numpy is not None and isinstance(covered, numpy.ndarray):
+        img = numpy.empty(covered.shape + (4,), dtype=numpy.uint8)
+        img[...,:3] = color
+        img[...,3] = (alpha*covered).astype(int)
+        for row in img:
+            yield array('B', row.tostring())
+        return
+
+    for row in covered:
+        out = array('B')
+        for s in row:
+            out.extend((r, g, b, int(alpha*s)))
+        yield out
+
+def get_img(i, size=size, samples=scale, color=COLOR, alpha=ALPHA):
+    return rgba_rows(coverage([i], size, samples)[i], color, alpha)
+
+def parse_color(s):
+    s = s.lstrip("#")
+    if len(s) != 6:
+        raise ValueError("color should be rrggbb: %s" % s)
+    return tuple(int(s[n:n+2], 16) for n in (0, 2, 4))
+
+def mkicons(size=size, samples=scale, color=COLOR, alpha=ALPHA, step=3, out_dir="."):
     p = png.Writer(width=size, height=size, alpha=True)
-    for i in range(0,360,3):
-        f = open("dir_%s.png" % i, "wb")
-        p.write(f, get_img(i))
+    headings = range(0, 360, step)
+    covered = coverage(headings, size, samples)
+    for i in headings:
+        f = open(os.path.join(out_dir, "dir_%s.png" % i), "wb")
+        p.write(f, rgba_rows(covered[i], color, alpha))
         f.close()
 
+def start(argv):
+    parser = optparse.OptionParser(usage="%prog [options]")
+    parser.add_option("--size", type="int", default=size)
+    parser.add_option("--samples", type="int", default=scale)
+    parser.add_option("--color", default="%02x%02x%02x" % COLOR)
+    parser.add_option("--alpha", type="int", default=ALPHA)
+    parser.add_option("--step", type="int", default=3)
+    parser.add_option("--out", default=".")
+    options, args = parser.parse_args(argv)
+
+    mkicons(options.size, options.samples, parse_color(options.color),
+            options.alpha, options.step, options.out)
+
 if __name__ == "__main__":
-    mkicons(*sys.argv[1:])
+    start(sys.argv[1:])
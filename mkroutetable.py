@@ -0,0 +1,365 @@
+"""
+Generate route_table.py and route_index.py
+
+route_table.py is every (route, stop tag, lat, lon) for buses and subways.
+route_index.py buckets route_table rows by location for RoutesInView.
+
+   python mkroutetable.py [options]
+
+   --mirror DIR   read feeds from DIR instead of the network:
+                    DIR/routeList.xml
+                    DIR/routeConfig/<route>.xml
+                    DIR/RealTimeHeavyRailKeys.csv
+   --save DIR     also write what we fetch to DIR, in the layout --mirror reads
+   --out DIR      where to write route_table.py and route_index.py (default: here)
+   --jobs N       number of parsing processes (default: one per cpu)
+   --fetchers N   number of routeConfigs to fetch at once (default 8)
+   --timeout SECS give up on a fetch after this long (default 30)
+   --index-only   rebuild route_index.py from the current route_table.py
+   --state FILE   where to keep what we knew last time
+                  (default: .route_table_state.json in the --out directory)
+   --full         ignore the state file and reparse every route
+
+We keep a hash of each route's routeConfig and the stops we got out of it
+in the state file.  Next time only routes whose routeConfig changed get
+parsed, and if nothing changed route_table.py and route_index.py are
+left alone.  We still have to fetch every routeConfig to see whether it
+changed; nextbus doesn't do conditional requests.
+
+Bus stops that directions refer to but routeConfig doesn't define are an
+error.  Stops no direction refers to we warn about; we need to tell the
+mbta about both.
+"""
+
+import sys
+import os
+import re
+import math
+import time
+import hashlib
+import urllib2
+import optparse
+import multiprocessing
+import multiprocessing.pool
+import simplejson as json
+
+BUS_FEED = "http://webservices.nextbus.com/service/publicXMLFeed?"
+SUBWAY_KEY = "http://developer.mbta.com/RT_Archive/RealTimeHeavyRailKeys.csv"
+
+# route_index cells are this many degrees on a side
+CELL_SIZE = 0.01
+
+# seconds before we give up on a fetch
+FETCH_TIMEOUT = 30
+
+_route_re = re.compile(r'<route\s([^>]*)>')
+_stop_re = re.compile(r'<stop\s([^>]*)>')
+_attr_re = re.compile(r'(\w+)="([^"]*)"')
+
+
+class FetchFailed(Exception):
+    pass
+
+
+class HttpFetcher(object):
+
+    """ fetch feeds from nextbus and the mbta """
+
+    def __init__(self, save_dir=None, timeout=FETCH_TIMEOUT):
+        self.save_dir = save_dir
+        self.timeout = timeout
+
+    def get(self, url, save_as):
+        try:
+            text = urllib2.urlopen(url, timeout=self.timeout).read()
+        except (urllib2.URLError, IOError), e:
+            raise FetchFailed("%s: %s" % (url, e))
+
+        if self.save_dir:
+            fname = os.path.join(self.save_dir, save_as)
+            if not os.path.isdir(os.path.dirname(fname)):
+                os.makedirs(os.path.dirname(fname))
+            f = open(fname, "w")
+            f.write(text)
+            f.close()
+        return text
+
+    def route_list(self):
+        return self.get(BUS_FEED + "command=routeList&a=mbta", "routeList.xml")
+
+    def route_config(self, route):
+        return self.get(BUS_FEED + "command=routeConfig&a=mbta&r=%s" % route,
+                        os.path.join("routeConfig", "%s.xml" % route))
+
+    def subway_keys(self):
+        return self.get(SUBWAY_KEY, "RealTimeHeavyRailKeys.csv")
+
+
+class MirrorFetcher(object):
+
+    """ read feeds from a local copy, as written by HttpFetcher(save_dir) """
+
+    def __init__(self, mirror_dir):
+        self.mirror_dir = mirror_dir
+
+    def get(self, fname):
+        try:
+            f = open(os.path.join(self.mirror_dir, fname))
+        except IOError, e:
+            raise FetchFailed(str(e))
+        try:
+            return f.read()
+        finally:
+            f.close()
+
+    def route_list(self):
+        return self.get("routeList.xml")
+
+    def route_config(self, route):
+        return self.get(os.path.join("routeConfig", "%s.xml" % route))
+
+    def subway_keys(self):
+        return self.get("RealTimeHeavyRailKeys.csv")
+
+
+def attributes(s):
+    return dict(_attr_re.findall(s))
+
+def parse_route_list(text):
+    return [attributes(m)["tag"] for m in _route_re.findall(text)]
+
+def parse_route_config(args):
+    """ (route, routeConfig text) -> (route, [(tag, lat, lon)], {tag: refs})
+
+    Stops with a location are definitions; stops without are references
+    from directions.  lat and lon stay strings so they're written out
+    exactly as nextbus gave them.
+    """
+
+    route, text = args
+
+    defs = []
+    refs = {}
+    for stop_string in _stop_re.findall(text):
+        a = attributes(stop_string)
+        tag = a["tag"]
+        if "lat" in a and "lon" in a:
+            if tag in refs:
+                raise ValueError("route %s defines stop %s twice" % (route, tag))
+            defs.append((tag, a["lat"], a["lon"]))
+            refs[tag] = 0
+        else:
+            if tag not in refs:
+                raise ValueError("route %s refers to undefined stop %s" % (route, tag))
+            refs[tag] += 1
+
+    return route, defs, refs
+
+def parse_subway_keys(text):
+    """ [(route, tag, lat, lon)] from RealTimeHeavyRailKeys.csv """
+
+    rows = []
+    for line in text.split("\n"):
+        if not line.strip() or line.startswith("Line"):
+            continue
+        fields = line.strip().split(",")
+        rows.append((fields[0], fields[1], fields[13], fields[14]))
+    return rows
+
+
+def digest(text):
+    return hashlib.sha1(text).hexdigest()
+
+def load_state(fname):
+    """ {"routes": {route: {"hash": ..., "defs": [[tag, lat, lon], ...]}},
+         "subway": {"hash": ..., "rows": [[route, tag, lat, lon], ...]}} """
+
+    try:
+        f = open(fname)
+    except IOError:
+        return {"routes": {}, "subway": {}}
+    try:
+        return json.load(f)
+    finally:
+        f.close()
+
+def save_state(fname, state):
+    write_atomically(fname, [json.dumps(state)])
+
+
+def cell(lat, lon, cell_size=CELL_SIZE):
+    return int(math.floor(lat/cell_size)), int(math.floor(lon/cell_size))
+
+def build_index(table, cell_size=CELL_SIZE):
+    """ cell -> (row in table, ...) """
+
+    cells = {}
+    for n, (route, tag, lat, lon) in enumerate(table):
+        cells.setdefault(cell(float(lat), float(lon), cell_size), []).append(n)
+    return cells
+
+
+def write_atomically(fname, lines):
+    tmp = fname + ".tmp"
+    f = open(tmp, "w")
+    try:
+        for line in lines:
+            f.write(line)
+    finally:
+        f.close()
+    os.rename(tmp, fname)
+
+def table_lines(table):
+    yield "# this file is autogenerated by mkroutetable.py\n"
+    yield "table = [\n"
+    for row in table:
+        yield "('%s', '%s', %s, %s),\n" % row
+    yield "]\n"
+
+def index_lines(table, cells, cell_size=CELL_SIZE):
+    yield "# this file is autogenerated by mkroutetable.py\n"
+    yield "# cell (int(floor(lat/cell_size)), int(floor(lon/cell_size))) -> rows in route_table.table\n"
+    yield "rows = %s\n" % len(table)
+    yield "cell_size = %r\n" % cell_size
+    yield "cells = {\n"
+    for c in sorted(cells):
+        yield "%r: %r,\n" % (c, tuple(cells[c]))
+    yield "}\n"
+
+
+class Stages(object):
+
+    """ report how long each stage takes """
+
+    def __init__(self, out=sys.stderr):
+        self.out = out
+        self.start = self.last = time.time()
+
+    def done(self, stage, note=""):
+        now = time.time()
+        self.out.write("%-8s %7.2fs %s\n" % (stage, now - self.last, note))
+        self.last = now
+
+    def total(self):
+        self.out.write("%-8s %7.2fs\n" % ("total", time.time() - self.start))
+
+
+def fetch_configs(fetcher, routes, n_fetchers):
+    """ [(route, routeConfig text)], fetching each route once """
+
+    pool = multiprocessing.pool.ThreadPool(n_fetchers)
+    try:
+        texts = pool.map(fetcher.route_config, routes)
+    finally:
+        pool.close()
+        pool.join()
+    return zip(routes, texts)
+
+def generate(fetcher, out_dir, jobs=None, n_fetchers=8, state_file=None, full=False):
+    stages = Stages()
+
+    if state_file is None:
+        state_file = os.path.join(out_dir, ".route_table_state.json")
+    if full:
+        state = {"routes": {}, "subway": {}}
+    else:
+        state = load_state(state_file)
+    known = state["routes"]
+
+    routes = parse_route_list(fetcher.route_list())
+    configs = fetch_configs(fetcher, routes, n_fetchers)
+    subway_text = fetcher.subway_keys()
+    stages.done("fetch", "%s routes" % len(routes))
+
+    hashes = dict((route, digest(text)) for route, text in configs)
+    changed = [(route, text) for route, text in configs
+               if route not in known or known[route]["hash"] != hashes[route]]
+    removed = [route for route in known if route not in hashes]
+
+    if changed:
+        pool = multiprocessing.Pool(jobs)
+        try:
+            parsed = pool.map(parse_route_config, changed)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        parsed = []
+
+    for route, defs, refs in parsed:
+        known[route] = {"hash": hashes[route], "defs": defs}
+        for tag, lat, lon in defs:
+            if not refs[tag]:
+                sys.stderr.write("Unreferenced stop %s for route %s\n" % (tag, route))
+    for route in removed:
+        del known[route]
+
+    subway_hash = digest(subway_text)
+    subway_changed = state["subway"].get("hash") != subway_hash
+    if subway_changed:
+        state["subway"] = {"hash": subway_hash, "rows": parse_subway_keys(subway_text)}
+    stages.done("parse", "%s of %s routes changed, %s removed%s" % (
+            len(changed), len(routes), len(removed),
+            ", subway changed" if subway_changed else ""))
+
+    table_fname = os.path.join(out_dir, "route_table.py")
+    index_fname = os.path.join(out_dir, "route_index.py")
+    if (not changed and not removed and not subway_changed and
+        os.path.exists(table_fname) and os.path.exists(index_fname)):
+        stages.done("emit", "nothing changed")
+        stages.total()
+        return
+
+    table = []
+    for route in routes:
+        for tag, lat, lon in known[route]["defs"]:
+            table.append((route, tag, lat, lon))
+    for route, tag, lat, lon in state["subway"]["rows"]:
+        table.append((route, tag, lat, lon))
+
+    write_atomically(table_fname, table_lines(table))
+    write_atomically(index_fname, index_lines(table, build_index(table)))
+    save_state(state_file, state)
+    stages.done("emit", "%s stops" % len(table))
+    stages.total()
+
+def generate_index(out_dir):
+    """ route_index.py for the route_table.py we already have """
+
+    import route_table
+    table = route_table.table
+    write_atomically(os.path.join(out_dir, "route_index.py"),
+                     index_lines(table, build_index(table)))
+
+def start(argv):
+    parser = optparse.OptionParser(usage="%prog [options]")
+    parser.add_option("--mirror", help="read feeds from this directory")
+    parser.add_option("--save", help="save fetched feeds to this directory")
+    parser.add_option("--out", default=os.path.dirname(os.path.abspath(__file__)),
+                      help="directory to write route_table.py and route_index.py to")
+    parser.add_option("--jobs", type="int", help="parsing processes")
+    parser.add_option("--fetchers", type="int", default=8,
+                      help="routeConfigs to fetch at once")
+    parser.add_option("--timeout", type="float", default=FETCH_TIMEOUT,
+                      help="seconds to wait on each fetch")
+    parser.add_option("--index-only", action="store_true",
+                      help="only rebuild route_index.py from route_table.py")
+    parser.add_option("--state", help="file to keep route hashes in between runs")
+    parser.add_option("--full", action="store_true",
+                      help="ignore the state file and reparse every route")
+    options, args = parser.parse_args(argv)
+
+    if options.index_only:
+        generate_index(options.out)
+        return
+
+    if options.mirror:
+        fetcher = MirrorFetcher(options.mirror)
+    else:
+        fetcher = HttpFetcher(options.save, options.timeout)
+
+    generate(fetcher, options.out, options.jobs, options.fetchers,
+             options.state, options.full)
+
+if __name__ == "__main__":
+    start(sys.argv[1:])
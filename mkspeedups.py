@@ -0,0 +1,36 @@
+"""
+Build simplejson's C speedups in place
+
+   python mkspeedups.py
+
+compiles simplejson/_speedups.c into simplejson/_speedups.so (or .pyd),
+next to the .py files, so simplejson finds it on import.  That works
+anywhere we run with a compiler: bench.py, replay.py, the sdk.  App
+engine won't load C extensions we upload, so there json_impl.py uses
+the standard library's json instead when it has its C encoder.
+
+python json_impl.py says which encoder we'd get.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+from distutils.core import setup, Extension
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+def mkspeedups():
+    os.chdir(here)
+    build_temp = tempfile.mkdtemp()
+    try:
+        setup(name="simplejson_speedups",
+              script_args=["build_ext", "--inplace", "--build-temp", build_temp],
+              ext_modules=[Extension("simplejson._speedups",
+                                     [os.path.join("simplejson", "_speedups.c")])])
+    finally:
+        shutil.rmtree(build_temp)
+
+if __name__ == "__main__":
+    mkspeedups()
+    sys.exit(os.system("%s %s" % (sys.executable, os.path.join(here, "json_impl.py"))))
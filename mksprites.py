@@ -0,0 +1,96 @@
+"""
+Pack the heading and minute icons in static into sprite sheets
+
+   python mksprites.py [static dir]
+
+reads static/dir_<deg>.png (from mkicons.py) and static/min<n>.png (from
+minute_image.py) and writes
+
+   static/headings.png   every dir_<deg>.png
+   static/minutes.png    every min<n>.png
+   static/sprites.json   where each icon is:
+
+   {"headings": {"url": "static/headings.png",
+                 "icons": {"0": [x, y, width, height], ...}},
+    "minutes": {...}}
+
+Icons are laid out on a grid of cells as big as the biggest icon, each
+in the top left of its cell.  index.html loads sprites.json and shows
+icons out of the sheets, so a map full of buses is two image requests
+instead of one for every heading and every minute.
+"""
+
+import sys
+import os
+import re
+import array
+import png
+import simplejson as json
+
+# icons per row of a sheet
+COLUMNS = {"headings": 12,
+           "minutes": 10}
+
+SHEETS = (("headings", re.compile(r"^dir_(\d+)\.png$")),
+          ("minutes", re.compile(r"^min(\d+)\.png$")))
+
+
+def read_icon(fname):
+    """ (width, height, [row of RGBA bytes, ...]) """
+
+    width, height, pixels, meta = png.Reader(filename=fname).asRGBA8()
+    return width, height, [array.array('B', row) for row in pixels]
+
+def read_icons(static_dir, pattern):
+    """ [(name, width, height, rows)] sorted by number """
+
+    icons = []
+    for fname in os.listdir(static_dir):
+        m = pattern.match(fname)
+        if m:
+            icons.append((int(m.group(1)),) + read_icon(os.path.join(static_dir, fname)))
+    icons.sort()
+    return [(str(n), width, height, rows) for n, width, height, rows in icons]
+
+def pack(icons, columns):
+    """ (width, height, rows, {name: [x, y, width, height]}) for a sheet
+    holding every icon """
+
+    cell_w = max(width for name, width, height, rows in icons)
+    cell_h = max(height for name, width, height, rows in icons)
+    n_rows = (len(icons) + columns - 1)//columns
+    sheet_w = cell_w*min(columns, len(icons))
+    sheet_h = cell_h*n_rows
+
+    sheet = [array.array('B', [0])*(4*sheet_w) for y in range(sheet_h)]
+    offsets = {}
+    for n, (name, width, height, rows) in enumerate(icons):
+        x, y = cell_w*(n % columns), cell_h*(n // columns)
+        for dy, row in enumerate(rows):
+            sheet[y+dy][4*x:4*(x+width)] = row
+        offsets[name] = [x, y, width, height]
+    return sheet_w, sheet_h, sheet, offsets
+
+def mksprites(static_dir="static"):
+    manifest = {}
+    for sheet_name, pattern in SHEETS:
+        icons = read_icons(static_dir, pattern)
+        if not icons:
+            sys.stderr.write("no icons for %s in %s\n" % (sheet_name, static_dir))
+            continue
+
+        width, height, sheet, offsets = pack(icons, COLUMNS[sheet_name])
+        fname = "%s.png" % sheet_name
+        f = open(os.path.join(static_dir, fname), "wb")
+        png.Writer(width=width, height=height, alpha=True).write(f, sheet)
+        f.close()
+
+        manifest[sheet_name] = {"url": "static/%s" % fname, "icons": offsets}
+        sys.stderr.write("%s: %s icons, %sx%s\n" % (sheet_name, len(icons), width, height))
+
+    f = open(os.path.join(static_dir, "sprites.json"), "w")
+    json.dump(manifest, f, sort_keys=True)
+    f.close()
+
+if __name__ == "__main__":
+    mksprites(*sys.argv[1:])
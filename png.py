@@ -180,6 +180,15 @@ import sys
 import zlib
 # http://www.python.org/doc/2.4.4/lib/module-warnings.html
 import warnings
+# Optional; used to filter and unfilter long scanlines.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Scanlines shorter than this many bytes are (un)filtered without
+# NumPy even when we have it; its setup costs more than the loop.
+numpy_min_bytes = 64
 
 
 __all__ = ['Image', 'Reader', 'Writer', 'write_chunks', 'from_array']
@@ -319,7 +328,8 @@ class Writer:
                  planes=None,
                  colormap=None,
                  maxval=None,
-                 chunk_limit=2**20):
+                 chunk_limit=2**20,
+                 filter_type=0):
         """
         Create a PNG encoder object.
 
@@ -349,6 +359,8 @@ class Writer:
           Create an interlaced image.
         chunk_limit
           Write multiple ``IDAT`` chunks to save memory.
+        filter_type
+          Scanline filter: 0 to 4, or ``'adaptive'``.
 
         The image size (in pixels) can be specified either by using the
         `width` and `height` arguments, or with the single `size`
@@ -435,6 +447,18 @@ class Writer:
         `chunk_limit` is used to limit the amount of memory used whilst
         compressing the image.  In order to avoid using large amounts of
         memory, multiple ``IDAT`` chunks may be created.
+
+        `filter_type` is the filter applied to each scanline before
+        compression (http://www.w3.org/TR/PNG/#9Filters ); the default,
+        0, is no filter.  ``'adaptive'`` picks a filter for each
+        scanline, see :func:`adaptive_filter`; it is slower, but
+        photographs and smooth gradients like map overlays usually
+        compress a good deal better.  Interlaced images are never
+        filtered.  Without NumPy, filtering is slow: "sub", "up" and
+        "average" take about half again as long as writing unfiltered,
+        and "paeth" and ``'adaptive'`` several times as long; that is
+        why tiles and icons, which are drawn on app engine without
+        NumPy, are written with the default.
         """
 
         # At the moment the `planes` argument is ignored;
@@ -580,6 +604,9 @@ class Writer:
         self.chunk_limit = chunk_limit
         self.interlace = bool(interlace)
         self.palette = check_palette(palette)
+        if filter_type not in (0, 1, 2, 3, 4, 'adaptive'):
+            raise ValueError("filter_type must be 0 to 4 or 'adaptive'")
+        self.filter_type = filter_type
 
         self.color_type = 4*self.alpha + 2*(not greyscale) + 1*self.colormap
         assert self.color_type in (0,2,3,4,6)
@@ -589,6 +616,18 @@ class Writer:
         # :todo: fix for bitdepth < 8
         self.psize = (self.bitdepth/8) * self.planes
 
+        # Filter offset, see :func:`filter_scanline`.
+        self.fo = max(1, self.psize)
+
+        # True when :meth:`write_fast` can write this image.  It holds
+        # the whole image at once, so only when that's in `chunk_limit`.
+        self.fast = (self.bitdepth == 8 and not self.rescale and
+                     not self.colormap and not self.interlace and
+                     self.transparent is None and
+                     self.background is None and self.gamma is None and
+                     self.height * (self.width * self.planes + 1) <= chunk_limit)
+        self._ihdr = None
+
     def make_palette(self):
         """Create the byte sequences for a ``PLTE`` and if necessary a
         ``tRNS`` chunk.  Returned as a pair (*p*, *t*).  *t* will be
@@ -626,6 +665,8 @@ class Writer:
             fmt = 'BH'[self.bitdepth > 8]
             a = array(fmt, itertools.chain(*rows))
             return self.write_array(outfile, a)
+        elif self.fast:
+            return self.write_fast(outfile, rows)
         else:
             nrows = self.write_passes(outfile, rows)
             if nrows != self.height:
@@ -633,6 +674,73 @@ class Writer:
                   "rows supplied (%d) does not match height (%d)" %
                   (nrows, self.height))
 
+    def filter_row(self, line, prev):
+        """Filter one scanline (of bytes) with this writer's
+        `filter_type`; `prev` is the previous scanline, unfiltered, or
+        ``None`` for the first.  Returns the filter type followed by the
+        filtered bytes.
+        """
+
+        if self.filter_type == 'adaptive':
+            return adaptive_filter(line, self.fo, prev)
+        return filter_scanline(self.filter_type, line, self.fo, prev)
+
+    def write_fast(self, outfile, rows):
+        """
+        Write a PNG image to the output file, for images with nothing
+        but pixels in them: 8-bit, no palette, not interlaced, and no
+        ``gAMA``, ``sBIT``, ``tRNS`` or ``bKGD`` chunks, that fit in
+        `chunk_limit` (see :attr:`fast`).  :meth:`write` uses this when
+        it can.
+
+        Rows are as for :meth:`write`.  The whole image is collected
+        and compressed with one call to zlib, and written as one
+        ``IDAT`` chunk; the ``IHDR`` chunk is only made once per
+        writer.  For small images like icons, :meth:`write_passes`
+        spends most of its time on per chunk and per row bookkeeping
+        rather than on compression, and this skips that.
+        """
+
+        if self._ihdr is None:
+            self._ihdr = chunk('IHDR',
+                               struct.pack("!2I5B", self.width, self.height,
+                                           self.bitdepth, self.color_type,
+                                           0, 0, 0))
+
+        data = array('B')
+        append, extend = data.append, data.extend
+        filtered = self.filter_type != 0
+        prev = None
+        nrows = 0
+        for row in rows:
+            start = len(data)
+            append(0)
+            try:
+                extend(row)
+            except TypeError:
+                # NumPy and other "nearly" int types, as in write_passes
+                extend(map(int, row))
+            if filtered:
+                line = data[start+1:]
+                data[start:] = self.filter_row(line, prev)
+                prev = line
+            nrows += 1
+        if nrows != self.height:
+            raise ValueError(
+              "rows supplied (%d) does not match height (%d)" %
+              (nrows, self.height))
+        if len(data) != self.height * (self.width * self.planes + 1):
+            raise ValueError("rows should have %d values each" %
+              (self.width * self.planes))
+
+        if self.compression is not None:
+            compressed = zlib.compress(tostring(data), self.compression)
+        else:
+            compressed = zlib.compress(tostring(data))
+
+        outfile.write(_signature + self._ihdr + chunk('IDAT', compressed) + _iend)
+        return nrows
+
     def write_passes(self, outfile, rows, packed=False):
         """
         Write a PNG image to the output file.
@@ -774,14 +882,24 @@ class Writer:
             del wrapmapint
             extend(row)
 
+        # Filter the rows if asked to.  Not for interlaced images:
+        # we do not mark the first row of a reduced pass image, so we
+        # could compute the wrong filtered scanline if we used "up",
+        # "average", or "paeth" on such a line.
+        filtered = self.filter_type != 0 and not self.interlace
+        if filtered:
+            prev = data[1:]
+            data[:] = self.filter_row(prev, None)
+
         for i,row in enumrows:
-            # Add "None" filter type.  Currently, it's essential that
-            # this filter type be used for every scanline as we do not
-            # mark the first row of a reduced pass image; that means we
-            # could accidentally compute the wrong filtered scanline if
-            # we used "up", "average", or "paeth" on such a line.
+            # Add "None" filter type; changed below if we're filtering.
+            start = len(data)
             data.append(0)
             extend(row)
+            if filtered:
+                line = data[start+1:]
+                data[start:] = self.filter_row(line, prev)
+                prev = line
             if len(data) > self.chunk_limit:
                 compressed = compressor.compress(tostring(data))
                 if len(compressed):
@@ -962,6 +1080,17 @@ def write_chunk(outfile, tag, data=''):
     checksum = zlib.crc32(data, checksum)
     outfile.write(struct.pack("!i", checksum))
 
+def chunk(tag, data=''):
+    """
+    A PNG chunk as a string, as :func:`write_chunk` would write it.
+    """
+
+    checksum = zlib.crc32(data, zlib.crc32(tag))
+    return struct.pack("!I", len(data)) + tag + data + struct.pack("!i", checksum)
+
+# Every PNG ends the same way.
+_iend = chunk('IEND')
+
 def write_chunks(out, chunks):
     """Create a PNG file by writing out the chunks."""
 
@@ -969,7 +1098,7 @@ def write_chunks(out, chunks):
     for chunk in chunks:
         write_chunk(out, *chunk)
 
-def filter_scanline(type, line, fo, prev=None):
+def filter_scanline(type, line, fo, prev=None, use_numpy=None):
     """Apply a scanline filter to a scanline.  `type` specifies the
     filter type (0 to 4); `line` specifies the current (unfiltered)
     scanline as a sequence of bytes; `prev` specifies the previous
@@ -977,81 +1106,196 @@ def filter_scanline(type, line, fo, prev=None):
     filter offset; normally this is size of a pixel in bytes (the number
     of bytes per sample times the number of channels), but when this is
     < 1 (for bit depths < 8) then the filter offset is 1.
+
+    Returns an array of bytes, the filter type followed by the
+    filtered scanline.  Every filter only looks at unfiltered bytes, so
+    all of them are done a whole scanline at a time, with NumPy if
+    `use_numpy` is true (by default, when NumPy is available and the
+    line is long enough).
     """
 
     assert 0 <= type < 5
 
-    # The output array.  Which, pathetically, we extend one-byte at a
-    # time (fortunately this is linear).
     out = array('B', [type])
 
-    def sub():
-        ai = -fo
-        for x in line:
-            if ai >= 0:
-                x = (x - line[ai]) & 0xff
-            out.append(x)
-            ai += 1
-    def up():
-        for i,x in enumerate(line):
-            x = (x - prev[i]) & 0xff
-            out.append(x)
-    def average():
-        ai = -fo
-        for i,x in enumerate(line):
-            if ai >= 0:
-                x = (x - ((line[ai] + prev[i]) >> 1)) & 0xff
-            else:
-                x = (x - (prev[i] >> 1)) & 0xff
-            out.append(x)
-            ai += 1
-    def paeth():
-        # http://www.w3.org/TR/PNG/#9Filter-type-4-Paeth
-        ai = -fo # also used for ci
-        for i,x in enumerate(line):
-            a = 0
-            b = prev[i]
-            c = 0
-
-            if ai >= 0:
-                a = line[ai]
-                c = prev[ai]
-            p = a + b - c
-            pa = abs(p - a)
-            pb = abs(p - b)
-            pc = abs(p - c)
-            if pa <= pb and pa <= pc: Pr = a
-            elif pb <= pc: Pr = b
-            else: Pr = c
-
-            x = (x - Pr) & 0xff
-            out.append(x)
-            ai += 1
-
     if not prev:
-        # We're on the first line.  Some of the filters can be reduced
-        # to simpler cases which makes handling the line "off the top"
-        # of the image simpler.  "up" becomes "none"; "paeth" becomes
-        # "left" (non-trivial, but true). "average" needs to be handled
-        # specially.
-        if type == 2: # "up"
-            return line # type = 0
-        elif type == 3:
-            prev = [0]*len(line)
-        elif type == 4: # "paeth"
+        # We're on the first line.  All the filters work as if the line
+        # "off the top" of the image is zeros, and some reduce to
+        # simpler ones: "up" is "none" and "paeth" is "sub".
+        if type == 2:
+            out.extend(line)
+            return out
+        if type == 4:
             type = 1
+        prev = array('B', [0])*len(line)
+
     if type == 0:
         out.extend(line)
-    elif type == 1:
-        sub()
-    elif type == 2:
-        up()
-    elif type == 3:
-        average()
-    else: # type == 4
-        paeth()
+        return out
+
+    if use_numpy is None:
+        use_numpy = numpy is not None and len(line) >= numpy_min_bytes
+    if use_numpy:
+        out.extend(_filter_numpy(type, line, fo, prev))
+    else:
+        out.extend(_filter_array(type, line, fo, prev))
     return out
 
+def _filter_array(type, line, fo, prev):
+    """:func:`filter_scanline`, without NumPy; returns a sequence of
+    bytes.  "sub", "up" and "average" are done on the whole line at
+    once, in a long (see :func:`_bytes_long`); "paeth" is a loop over
+    the bytes, and several times slower.
+    """
+
+    n = len(line)
+    if type != 4:
+        masks = _byte_masks(n)
+        x = _bytes_long(line)
+        if type == 1:
+            d = _sub_bytes(x, x >> 8*fo, masks)
+        elif type == 2:
+            d = _sub_bytes(x, _bytes_long(prev), masks)
+        else:
+            d = _sub_bytes(x, _average_bytes(x >> 8*fo, _bytes_long(prev), masks),
+                           masks)
+        return _long_bytes(d, n)
+    # Paeth
+    # http://www.w3.org/TR/PNG/#9Filter-type-4-Paeth
+    left = [0]*fo + list(line[:n-fo])
+    upleft = [0]*fo + list(prev[:n-fo])
+    out = []
+    append = out.append
+    for x,a,b,c in zip(line, left, prev, upleft):
+        pa = abs(b - c)
+        pb = abs(a - c)
+        pc = abs(a + b - c - c)
+        if pa <= pb and pa <= pc: Pr = a
+        elif pb <= pc: Pr = b
+        else: Pr = c
+        append((x - Pr) & 0xff)
+    return out
+
+# Python's longs do arithmetic on thousands of bits at C speed, which
+# we use to (un)filter a whole scanline at once without NumPy.  A
+# scanline is one long, first byte most significant, so shifting it
+# right by 8*fo bits lines each byte up with the one a pixel to its
+# left.  Bytewise arithmetic is done on every other byte at a time,
+# each in a 16-bit lane with room for a carry (or, biased by 256, a
+# borrow) that doesn't reach the next one.
+def _bytes_long(seq):
+    """A sequence of bytes as a long, first byte most significant."""
+
+    if not (isinstance(seq, array) and seq.typecode == 'B'):
+        seq = array('B', seq)
+    return long(seq.tostring().encode('hex') or '0', 16)
+
+def _long_bytes(v, n):
+    """The last `n` bytes of `v`, as an array."""
+
+    if not n:
+        return array('B')
+    h = '%x' % v
+    if len(h) > 2*n:
+        h = h[-2*n:]
+    return array('B', ('0'*(2*n - len(h)) + h).decode('hex'))
+
+_byte_mask_cache = {}
+def _byte_masks(n):
+    """(255 in every 16-bit lane, 256 in every lane) for `n` bytes."""
+
+    if n not in _byte_mask_cache:
+        if len(_byte_mask_cache) > 16:
+            _byte_mask_cache.clear()
+        lanes = (n + 1)//2
+        _byte_mask_cache[n] = (long('00ff'*lanes or '0', 16),
+                               long('0100'*lanes or '0', 16))
+    return _byte_mask_cache[n]
+
+def _add_bytes(x, y, masks):
+    """(x + y) & 0xff for each byte of longs `x` and `y`."""
+
+    low, bias = masks
+    return (((((x >> 8) & low) + ((y >> 8) & low)) & low) << 8 |
+            (((x & low) + (y & low)) & low))
+
+def _sub_bytes(x, y, masks):
+    """(x - y) & 0xff for each byte of longs `x` and `y`."""
+
+    low, bias = masks
+    return (((((x >> 8) & low | bias) - ((y >> 8) & low)) & low) << 8 |
+            ((((x & low) | bias) - (y & low)) & low))
+
+def _average_bytes(x, y, masks):
+    """(x + y) >> 1 for each byte of longs `x` and `y`."""
+
+    low, bias = masks
+    return (((((x >> 8) & low) + ((y >> 8) & low)) >> 1 & low) << 8 |
+            ((((x & low) + (y & low)) >> 1) & low))
+
+def _numpy_bytes(seq):
+    """A NumPy array of bytes; without a copy, for arrays of bytes."""
+
+    if isinstance(seq, array) and seq.typecode == 'B':
+        return numpy.frombuffer(seq, dtype=numpy.uint8)
+    return numpy.asarray(seq, dtype=numpy.uint8)
+
+def _filter_numpy(type, line, fo, prev):
+    """:func:`filter_scanline`, with NumPy; returns an array of bytes."""
+
+    x = _numpy_bytes(line).astype(numpy.int16)
+    b = _numpy_bytes(prev).astype(numpy.int16)
+    if type == 2:
+        d = x - b
+    else:
+        a = numpy.zeros_like(x)
+        a[fo:] = x[:-fo]
+        if type == 1:
+            d = x - a
+        elif type == 3:
+            d = x - ((a + b) >> 1)
+        else:
+            c = numpy.zeros_like(x)
+            c[fo:] = b[:-fo]
+            pa = numpy.abs(b - c)
+            pb = numpy.abs(a - c)
+            pc = numpy.abs(a + b - c - c)
+            Pr = numpy.where((pa <= pb) & (pa <= pc), a,
+                             numpy.where(pb <= pc, b, c))
+            d = x - Pr
+    return array('B', (d & 0xff).astype(numpy.uint8).tostring())
+
+def adaptive_filter(line, fo, prev=None, use_numpy=None):
+    """Filter a scanline with whichever filter type looks like it
+    will compress best: the one that leaves the smallest sum of bytes
+    taken as signed differences (the heuristic from
+    http://www.w3.org/TR/PNG/#12Filter-selection ).  Returns the same
+    as :func:`filter_scanline`.
+    """
+
+    if use_numpy is None:
+        use_numpy = numpy is not None and len(line) >= numpy_min_bytes
+
+    best = None
+    for type in range(5):
+        if not prev and type in (2, 4):
+            # The same as 0 and 1 on the first line.
+            continue
+        out = filter_scanline(type, line, fo, prev, use_numpy)
+        if use_numpy:
+            d = numpy.frombuffer(out, dtype=numpy.int8, offset=1)
+            cost = int(numpy.abs(d.astype(numpy.int16)).sum())
+        else:
+            cost = 0
+            for x in out[1:]:
+                if x < 128:
+                    cost += x
+                else:
+                    cost += 256 - x
+        if best is None or cost < best[0]:
+            best = cost, out
+    return best[1]
+
 
 def from_array(a, mode=None, info={}):
     """Create a PNG :class:`Image` object from a 2- or 3-dimensional array.
@@ -1438,8 +1682,12 @@ class Reader:
         # create the array to be the right size is to copy from an
         # existing sequence.  *sigh*
         # If we fill the result with scanline, then this allows a
-        # micro-optimisation in the "null" and "sub" cases.
-        result = array('B', scanline)
+        # micro-optimisation in the "null" and "sub" cases.  Copying
+        # an array of bytes by slicing is much faster than array() on it.
+        if isinstance(scanline, array) and scanline.typecode == 'B':
+            result = scanline[:]
+        else:
+            result = array('B', scanline)
 
         if filter_type == 0:
             # And here, we _rely_ on filling the result with scanline,
@@ -1461,78 +1709,95 @@ class Reader:
         # first line 'up' is the same as 'null', 'paeth' is the same
         # as 'sub', with only 'average' requiring any special case.
         if not previous:
-            previous = array('B', [0]*len(scanline))
+            previous = array('B', [0])*len(scanline)
+
+        n = len(result)
+        use_numpy = numpy is not None and n >= numpy_min_bytes
+
+        # "sub" and "up" don't depend on bytes of this line we haven't
+        # decoded yet, so they're done on the whole line at once, with
+        # NumPy or in a long: "up" is an add, "sub" a running sum
+        # in each byte of a pixel.  A byte of "average" and "paeth"
+        # depends on the byte a pixel to the left, after it is decoded,
+        # so those are done a byte at a time, and are several times
+        # slower.
 
         def sub():
             """Undo sub filter."""
 
-            ai = 0
-            # Loops starts at index fu.  Observe that the initial part
-            # of the result is already filled in correctly with
-            # scanline.
-            for i in range(fu, len(result)):
-                x = scanline[i]
-                a = result[ai]
-                result[i] = (x + a) & 0xff
-                ai += 1
+            if use_numpy and n % fu == 0:
+                x = numpy.frombuffer(result, dtype=numpy.uint8).reshape(-1, fu)
+                result[:] = array('B',
+                  numpy.cumsum(x, axis=0, dtype=numpy.uint8).tostring())
+                return
+            # A running sum by doubling: after adding the bytes
+            # `shift` to the left, each byte is the sum of the
+            # 2*shift/fu bytes up to it.
+            masks = _byte_masks(n)
+            x = _bytes_long(result)
+            shift = fu
+            while shift < n:
+                x = _add_bytes(x, x >> 8*shift, masks)
+                shift *= 2
+            result[:] = _long_bytes(x, n)
 
         def up():
             """Undo up filter."""
 
-            for i in range(len(result)):
-                x = scanline[i]
-                b = previous[i]
-                result[i] = (x + b) & 0xff
+            if use_numpy:
+                x = numpy.frombuffer(result, dtype=numpy.uint8)
+                b = numpy.frombuffer(previous, dtype=numpy.uint8)
+                result[:] = array('B', (x + b).tostring())
+                return
+            result[:] = _long_bytes(_add_bytes(_bytes_long(result),
+                                               _bytes_long(previous),
+                                               _byte_masks(n)), n)
 
         def average():
             """Undo average filter."""
 
-            ai = -fu
-            for i in range(len(result)):
-                x = scanline[i]
-                if ai < 0:
-                    a = 0
-                else:
-                    a = result[ai]
-                b = previous[i]
-                result[i] = (x + ((a + b) >> 1)) & 0xff
-                ai += 1
+            for i in range(min(fu, n)):
+                result[i] = (scanline[i] + (previous[i] >> 1)) & 0xff
+            for i in range(fu, n):
+                result[i] = (scanline[i] +
+                             ((result[i-fu] + previous[i]) >> 1)) & 0xff
 
         def paeth():
             """Undo Paeth filter."""
 
-            # Also used for ci.
-            ai = -fu
-            for i in range(len(result)):
-                x = scanline[i]
-                if ai < 0:
-                    a = c = 0
-                else:
-                    a = result[ai]
-                    c = previous[ai]
+            # With nothing to the left the predictor is always the byte
+            # above.
+            for i in range(min(fu, n)):
+                result[i] = (scanline[i] + previous[i]) & 0xff
+            for i in range(fu, n):
+                a = result[i-fu]
                 b = previous[i]
-                p = a + b - c
-                pa = abs(p - a)
-                pb = abs(p - b)
-                pc = abs(p - c)
+                c = previous[i-fu]
+                pa = abs(b - c)
+                pb = abs(a - c)
+                pc = abs(a + b - c - c)
                 if pa <= pb and pa <= pc:
                     pr = a
                 elif pb <= pc:
                     pr = b
                 else:
                     pr = c
-                result[i] = (x + pr) & 0xff
-                ai += 1
+                result[i] = (scanline[i] + pr) & 0xff
 
         # Call appropriate filter algorithm.  Note that 0 has already
         # been dealt with.
         (None, sub, up, average, paeth)[filter_type]()
         return result
 
-    def deinterlace(self, raw):
+    def deinterlace(self, raw, out=None):
         """
         Read raw pixel data, undo filters, deinterlace, and flatten.
         Return in flat row flat pixel format.
+
+        `raw` is the decompressed data: an array of all of it, or an
+        iterator that yields it in pieces, as :meth:`iterdecomp` does.
+        The result goes in `out` if it is given, which should be an
+        array big enough for it (see :meth:`read_rows_into`).
         """
 
         # print >> sys.stderr, ("Reading interlaced, w=%s, r=%s, planes=%s," +
@@ -1543,9 +1808,27 @@ class Reader:
         # Make a result array, and make it big enough.  Interleaving
         # writes to the output array randomly (well, not quite), so the
         # entire output array must be in memory.
-        fmt = 'BH'[self.bitdepth > 8]
-        a = array(fmt, [0]*vpr*self.height)
-        source_offset = 0
+        if out is None:
+            fmt = 'BH'[self.bitdepth > 8]
+            a = array(fmt, [0])*(vpr*self.height)
+        else:
+            a = out
+
+        # Raw data is taken a scanline at a time from the pieces.
+        if isinstance(raw, array):
+            raw = [raw]
+        pieces = iter(raw)
+        pending = array('B')
+        def take(n):
+            while len(pending) < n:
+                try:
+                    pending.extend(pieces.next())
+                except StopIteration:
+                    raise FormatError(
+                      'Wrong size for decompressed IDAT chunk.')
+            some = pending[:n]
+            del pending[:n]
+            return some
 
         for xstart, ystart, xstep, ystep in _adam7:
             # print >> sys.stderr, "Adam7: start=%s,%s step=%s,%s" % (
@@ -1561,10 +1844,9 @@ class Reader:
             # Row size in bytes for this pass.
             row_size = int(math.ceil(self.psize * ppr))
             for y in range(ystart, self.height, ystep):
-                filter_type = raw[source_offset]
-                source_offset += 1
-                scanline = raw[source_offset:source_offset+row_size]
-                source_offset += row_size
+                line = take(row_size + 1)
+                filter_type = line[0]
+                scanline = line[1:]
                 recon = self.undo_filter(filter_type, scanline, recon)
                 # Convert so that there is one element per pixel value
                 flat = self.serialtoflat(recon, ppr)
@@ -1834,77 +2116,116 @@ class Reader:
                 not self.colormap and len(data) != self.planes):
                 raise FormatError("sBIT chunk has incorrect length.")
 
+    def iteridat(self):
+        """Iterator that yields all the ``IDAT`` chunks as strings."""
+        while True:
+            try:
+                type, data = self.chunk()
+            except ValueError, e:
+                raise ChunkError(e.args[0])
+            if type == 'IEND':
+                # http://www.w3.org/TR/PNG/#11IEND
+                break
+            if type != 'IDAT':
+                continue
+            # type == 'IDAT'
+            # http://www.w3.org/TR/PNG/#11IDAT
+            if self.colormap and not self.plte:
+                warnings.warn("PLTE chunk is required before IDAT chunk")
+            yield data
+
+    def iterdecomp(self, idat, max_length=None):
+        """Iterator that yields decompressed data as arrays of bytes.
+        `idat` should be an iterator that yields the ``IDAT`` chunk
+        data.  No array is longer than `max_length` bytes (by default
+        one filtered row, see :meth:`preamble`), so however big an
+        ``IDAT`` chunk is only a row or so of it is decompressed at a
+        time.
+        """
+
+        if max_length is None:
+            max_length = self.row_bytes + 1
+        d = zlib.decompressobj()
+        for data in idat:
+            while data:
+                some = d.decompress(data, max_length)
+                data = d.unconsumed_tail
+                if some:
+                    yield array('B', some)
+        # Anything zlib was still holding on to.
+        some = d.flush()
+        if some:
+            yield array('B', some)
+
+    def metadata(self):
+        """The metadata dictionary that :meth:`read` returns; call
+        :meth:`preamble` first."""
+
+        meta = dict()
+        for attr in 'greyscale alpha planes bitdepth interlace'.split():
+            meta[attr] = getattr(self, attr)
+        meta['size'] = (self.width, self.height)
+        for attr in 'gamma transparent background'.split():
+            a = getattr(self, attr, None)
+            if a is not None:
+                meta[attr] = a
+        return meta
+
     def read(self):
         """
         Read the PNG file and decode it.  Returns (`width`, `height`,
         `pixels`, `metadata`).
 
-        May use excessive memory.
+        Rows are decompressed and decoded as `pixels` is iterated over,
+        so for a straightlaced image memory use is about a row at a
+        time.  Interlaced images are decoded whole.
 
         `pixels` are returned in boxed row flat pixel format.
         """
 
-        def iteridat():
-            """Iterator that yields all the ``IDAT`` chunks as strings."""
-            while True:
-                try:
-                    type, data = self.chunk()
-                except ValueError, e:
-                    raise ChunkError(e.args[0])
-                if type == 'IEND':
-                    # http://www.w3.org/TR/PNG/#11IEND
-                    break
-                if type != 'IDAT':
-                    continue
-                # type == 'IDAT'
-                # http://www.w3.org/TR/PNG/#11IDAT
-                if self.colormap and not self.plte:
-                    warnings.warn("PLTE chunk is required before IDAT chunk")
-                yield data
-
-        def iterdecomp(idat):
-            """Iterator that yields decompressed strings.  `idat` should
-            be an iterator that yields the ``IDAT`` chunk data.
-            """
-
-            # Currently, with no max_length paramter to decompress, this
-            # routine will do one yield per IDAT chunk.  So not very
-            # incremental.
-            d = zlib.decompressobj()
-            # The decompression loop:
-            # Decompress an IDAT chunk, then decompress any remaining
-            # unused data until the unused data does not get any
-            # smaller.  Add the unused data to the front of the input
-            # and loop to process the next IDAT chunk.
-            cdata = ''
-            for data in idat:
-                # :todo: add a max_length argument here to limit output
-                # size.
-                yield array('B', d.decompress(cdata + data))
-            yield array('B', d.flush())
-
         self.preamble()
-        raw = iterdecomp(iteridat())
+        raw = self.iterdecomp(self.iteridat())
 
         if self.interlace:
-            raw = array('B', itertools.chain(*raw))
-            arraycode = 'BH'[self.bitdepth>8]
-            # Like :meth:`group` but producing an array.array object for
-            # each row.
-            pixels = itertools.imap(lambda *row: array(arraycode, row),
-                       *[iter(self.deinterlace(raw))]*self.width*self.planes)
+            a = self.deinterlace(raw)
+            vpr = self.width * self.planes
+            pixels = (a[y*vpr:(y+1)*vpr] for y in range(self.height))
         else:
             pixels = self.iterboxed(self.iterstraight(raw))
-        meta = dict()
-        for attr in 'greyscale alpha planes bitdepth interlace'.split():
-            meta[attr] = getattr(self, attr)
-        meta['size'] = (self.width, self.height)
-        for attr in 'gamma transparent background'.split():
-            a = getattr(self, attr, None)
-            if a is not None:
-                meta[attr] = a
-        return self.width, self.height, pixels, meta
+        return self.width, self.height, pixels, self.metadata()
 
+    def read_rows_into(self, buffer):
+        """
+        Read the PNG file and decode it into `buffer`, in flat row flat
+        pixel format.  Returns (*width*, *height*, *buffer*,
+        *metadata*).
+
+        `buffer` should be an ``array('B')``, or ``array('H')`` for
+        bit depths over 8, with room for at least *width* * *planes* *
+        *height* values; call :meth:`preamble` first to find out what
+        those are.  Apart from `buffer` memory use is about a row, so
+        one buffer can be used to read image after image.
+        """
+
+        self.preamble()
+        vpr = self.width * self.planes
+        arraycode = 'BH'[self.bitdepth > 8]
+        if getattr(buffer, 'typecode', None) != arraycode:
+            raise Error("buffer should be array('%s') for bit depth %d" %
+              (arraycode, self.bitdepth))
+        if len(buffer) < vpr * self.height:
+            raise Error("buffer has room for %d values, image has %d" %
+              (len(buffer), vpr * self.height))
+
+        raw = self.iterdecomp(self.iteridat())
+        if self.interlace:
+            self.deinterlace(raw, buffer)
+        else:
+            offset = 0
+            for row in self.iterboxed(self.iterstraight(raw)):
+                buffer[offset:offset+vpr] = row
+                offset += vpr
+        return self.width, self.height, buffer, self.metadata()
 
     def read_flat(self):
         """
@@ -2718,6 +3039,128 @@ class Test(unittest.TestCase):
         pixels = numpy.array([[0,0x5555],[0x5555,0xaaaa]], numpy.uint16)
         img = from_array(pixels, 'L')
         img.save('testnumpyL16.png')
+    def helperFast(self, **k):
+        """write_fast makes the same file write_passes does."""
+        planes = 1 + 2*(not k.get('greyscale')) + bool(k.get('alpha'))
+        rows = [array('B', [(x*7 + y*13) & 0xff for x in range(5*planes)])
+                for y in range(3)]
+        w = Writer(5, 3, **k)
+        self.assert_(w.fast)
+        fast = StringIO()
+        w.write(fast, rows)
+        slow = StringIO()
+        w.write_passes(slow, rows)
+        self.assertEqual(fast.getvalue(), slow.getvalue())
+        x,y,pixels,meta = Reader(bytes=fast.getvalue()).read()
+        self.assertEqual(map(list, pixels), map(list, rows))
+    def testFastRGB(self):
+        self.helperFast()
+    def testFastRGBA(self):
+        self.helperFast(alpha=True)
+    def testFastLA(self):
+        self.helperFast(greyscale=True, alpha=True, compression=9)
+    def testFastNotUsed(self):
+        """Chunks write_fast doesn't write mean it isn't used."""
+        self.assert_(not Writer(1, 1, gamma=0.5).fast)
+        self.assert_(not Writer(1, 1, transparent=(1,2,3)).fast)
+        self.assert_(not Writer(1, 1, bitdepth=16).fast)
+        self.assert_(not Writer(1, 1, interlace=True).fast)
+    def testFastChunkLimit(self):
+        """Images bigger than chunk_limit go through write_passes, in
+        several IDAT chunks."""
+        w = Writer(16, 16, greyscale=True, chunk_limit=100)
+        self.assert_(not w.fast)
+        self.assert_(Writer(16, 16, greyscale=True, chunk_limit=272).fast)
+        rows = [[(x*y) & 0xff for x in range(16)] for y in range(16)]
+        o = StringIO()
+        w.write(o, rows)
+        r = Reader(bytes=o.getvalue())
+        idats = [data for type, data in r.chunks() if type == 'IDAT']
+        self.assert_(len(idats) > 1)
+        x,y,pixels,meta = Reader(bytes=o.getvalue()).read()
+        self.assertEqual(map(list, pixels), rows)
+    def testFastShortRow(self):
+        w = Writer(2, 2)
+        self.assertRaises(ValueError, w.write, StringIO(), [[0]*6, [0]*5])
+        self.assertRaises(ValueError, w.write, StringIO(), [[0]*6])
+    def testReadRowsInto(self):
+        """read_rows_into gets the same pixels as read_flat."""
+        for name in ('basn0g01', 'basn0g16', 'basn2c08', 'basn6a16',
+                     'basi0g04', 'basi2c16', 'basi6a08'):
+            x,y,flat,meta = Reader(bytes=_pngsuite[name]).read_flat()
+            # One buffer, used twice, so the second read overwrites
+            # the first.
+            buffer = array('BH'[meta['bitdepth'] > 8], [0]*len(flat))
+            for i in range(2):
+                x,y,pixels,meta = Reader(
+                  bytes=_pngsuite[name]).read_rows_into(buffer)
+                self.assert_(pixels is buffer)
+                self.assertEqual(list(buffer), list(flat))
+    def testReadRowsIntoWrongBuffer(self):
+        r = Reader(bytes=_pngsuite['basn0g16'])
+        self.assertRaises(Error, r.read_rows_into, array('B', [0]*4096))
+        r = Reader(bytes=_pngsuite['basn2c08'])
+        self.assertRaises(Error, r.read_rows_into, array('B', [0]*10))
+    def testDecompressByRow(self):
+        """A big IDAT chunk is decompressed a row at a time."""
+        w = Writer(64, 64, greyscale=True)
+        f = StringIO()
+        w.write(f, [[(x*y) & 0xff for x in range(64)] for y in range(64)])
+        r = Reader(bytes=f.getvalue())
+        r.preamble()
+        pieces = list(r.iterdecomp(r.iteridat()))
+        self.assertEqual(sum(map(len, pieces)), 65*64)
+        self.assert_(max(map(len, pieces)) <= 65)
+    def testFilterScanline(self):
+        """Every filter type undoes, with and without NumPy."""
+        r = Reader(bytes=_pngsuite['basn2c08'])
+        r.preamble()
+        prev = array('B', [(x*37) & 0xff for x in range(96)])
+        line = array('B', [(x*x + 11) & 0xff for x in range(96)])
+        for type in range(5):
+            for p in (None, prev):
+                out = filter_scanline(type, line, 3, p, use_numpy=False)
+                self.assertEqual(out[0], type)
+                self.assertEqual(list(r.undo_filter(type, out[1:], p)),
+                                 list(line))
+                if numpy is not None:
+                    self.assertEqual(out,
+                      filter_scanline(type, line, 3, p, use_numpy=True))
+    def testFilterFirstUp(self):
+        """"up" on the first line keeps its filter type byte."""
+        self.assertEqual(list(filter_scanline(2, [1, 2, 3], 1)),
+                         [2, 1, 2, 3])
+    def helperFilterType(self, filter_type, **k):
+        """An image written with a filter reads back the same."""
+        planes = 1 + 2*(not k.get('greyscale')) + bool(k.get('alpha'))
+        maxval = 2**k.get('bitdepth', 8) - 1
+        rows = [[(x*7 + y*y*13) % (maxval+1) for x in range(20*planes)]
+                for y in range(9)]
+        w = Writer(20, 9, filter_type=filter_type, **k)
+        f = StringIO()
+        w.write(f, rows)
+        x,y,pixels,meta = Reader(bytes=f.getvalue()).read()
+        self.assertEqual(map(list, pixels), rows)
+        return f.getvalue()
+    def testFilterTypes(self):
+        for filter_type in (1, 2, 3, 4, 'adaptive'):
+            self.helperFilterType(filter_type)
+            self.helperFilterType(filter_type, alpha=True, chunk_limit=50)
+            self.helperFilterType(filter_type, greyscale=True, bitdepth=16)
+            self.helperFilterType(filter_type, greyscale=True, bitdepth=2)
+            self.helperFilterType(filter_type, interlace=True)
+    def testFilterAdaptiveSmaller(self):
+        """Adaptive filtering makes a gradient smaller."""
+        rows = [[(x + y) & 0xff for x in range(64)] for y in range(64)]
+        sizes = []
+        for filter_type in (0, 'adaptive'):
+            f = StringIO()
+            Writer(64, 64, greyscale=True,
+                   filter_type=filter_type).write(f, rows)
+            sizes.append(len(f.getvalue()))
+        self.assert_(sizes[1] < sizes[0])
+    def testFilterTypeBad(self):
+        self.assertRaises(ValueError, Writer, 1, 1, filter_type=5)
 
 # === Command Line Support ===
 
@@ -0,0 +1,159 @@
+"""
+Reduce NextBus predictions to each vehicle's next stop.
+
+A route's predictions come back as one row per (stop, vehicle) pair,
+spread over several predictionsForMultiStops documents.  We collect
+the rows from every document first and then pick each vehicle's best
+next stop in one batch: the soonest prediction at least two minutes
+out, with ties going to the stop nearest the vehicle.
+
+The batch reduction uses numpy when it's available and falls back to
+a plain loop otherwise (app engine doesn't have numpy).
+"""
+
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# below this many rows numpy's setup costs more than the loop
+NUMPY_MIN_ROWS = 256
+
+
+class PredictionTable(object):
+
+    """ prediction rows for one route
+
+    vehicle codes index into bus_lats/bus_lons; vehicles, seconds, lats
+    and lons are per row.  The per row columns are arrays so numpy can
+    use them without copying.  full maps bus_id -> [(stop_tag, dirTag,
+    seconds)]
+    """
+
+    def __init__(self, stops, bus_hash):
+        self.stops = stops
+        self.bus_hash = bus_hash
+
+        self.codes = {} # bus_id -> vehicle code
+        self.ids = []
+        self.bus_lats = []
+        self.bus_lons = []
+
+        self.vehicles = array('l')
+        self.seconds = array('d')
+        self.lats = array('d')
+        self.lons = array('d')
+
+        self.full = {}
+
+    def __len__(self):
+        return len(self.vehicles)
+
+    def code_for(self, vehicle):
+        try:
+            return self.codes[vehicle]
+        except KeyError:
+            bus = self.bus_hash[vehicle]
+            code = self.codes[vehicle] = len(self.ids)
+            self.ids.append(vehicle)
+            self.bus_lats.append(bus.lat)
+            self.bus_lons.append(bus.lon)
+            self.full[vehicle] = []
+            return code
+
+    def add(self, xmldoc, doc_age):
+        """ add the rows from a predictionsForMultiStops document """
+
+        bus_hash = self.bus_hash
+        vehicles, seconds_col = self.vehicles, self.seconds
+        lats, lons = self.lats, self.lons
+
+        for predictions in xmldoc.getElementsByTagName("predictions"):
+            stop = self.stops[predictions.getAttribute("stopTag")]
+            tag, lat, lon = stop.tag, stop.lat, stop.lon
+
+            for prediction in predictions.getElementsByTagName("prediction"):
+                vehicle = prediction.getAttribute("vehicle")
+                if vehicle not in bus_hash:
+                    continue
+
+                seconds = 60*int(prediction.getAttribute("minutes")) - doc_age
+                code = self.code_for(vehicle)
+
+                self.full[vehicle].append((tag, prediction.getAttribute("dirTag"), seconds))
+
+                vehicles.append(code)
+                seconds_col.append(seconds)
+                lats.append(lat)
+                lons.append(lon)
+
+    def best(self, min_seconds=60*2, use_numpy=None):
+        """ bus_id -> (seconds, stop_lat, stop_lon) for each vehicle's
+        next stop at least min_seconds away
+
+        use_numpy: None picks based on the number of rows
+        """
+
+        if use_numpy is None:
+            use_numpy = numpy is not None and len(self) >= NUMPY_MIN_ROWS
+
+        if use_numpy:
+            return self._best_numpy(min_seconds)
+        return self._best_loop(min_seconds)
+
+    def _best_loop(self, min_seconds):
+        best = {} # code -> (seconds, lat, lon, distance)
+        bus_lats, bus_lons = self.bus_lats, self.bus_lons
+
+        for code, seconds, lat, lon in zip(self.vehicles, self.seconds,
+                                           self.lats, self.lons):
+            if seconds < min_seconds:
+                continue
+
+            o = best.get(code)
+            if o is not None and seconds > o[0]:
+                continue
+
+            c_lat, c_lon = bus_lats[code], bus_lons[code]
+            d = (c_lat-lat)*(c_lat-lat) + (c_lon-lon)*(c_lon-lon)
+
+            if o is None or seconds < o[0] or d < o[3]:
+                best[code] = seconds, lat, lon, d
+
+        ids = self.ids
+        return dict((ids[code], (seconds, lat, lon))
+                    for code, (seconds, lat, lon, d) in best.items())
+
+    def _best_numpy(self, min_seconds):
+        if not self.vehicles:
+            return {}
+
+        codes = numpy.frombuffer(self.vehicles, dtype=numpy.dtype('l'))
+        seconds = numpy.frombuffer(self.seconds, dtype=float)
+        lats = numpy.frombuffer(self.lats, dtype=float)
+        lons = numpy.frombuffer(self.lons, dtype=float)
+
+        keep = numpy.nonzero(seconds >= min_seconds)[0]
+        if not len(keep):
+            return {}
+        codes, seconds, lats, lons = codes[keep], seconds[keep], lats[keep], lons[keep]
+
+        d_lat = numpy.array(self.bus_lats, dtype=float)[codes] - lats
+        d_lon = numpy.array(self.bus_lons, dtype=float)[codes] - lons
+        d = d_lat*d_lat + d_lon*d_lon
+
+        # lexsort is stable, so among equally near stops at the same time
+        # the first row wins, same as the loop
+        order = numpy.lexsort((d, seconds, codes))
+        codes = codes[order]
+        first = numpy.ones(len(codes), dtype=bool)
+        first[1:] = codes[1:] != codes[:-1]
+        rows = order[first]
+
+        ids = self.ids
+        # hand back the original python values, not numpy scalars
+        orig = keep[rows].tolist()
+        return dict((ids[self.vehicles[i]], (self.seconds[i], self.lats[i], self.lons[i]))
+                    for i in orig)
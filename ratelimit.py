@@ -0,0 +1,159 @@
+"""
+How fast we let ourselves fetch from upstream
+
+Every feed fetch asks ratelimit.limiter first:
+
+   if ratelimit.limiter.allow(kind, backend):
+       ... fetch ...
+   else:
+       ... make do with what's cached ...
+
+or, for several fetches of a kind with one trip to the cache,
+
+   n = ratelimit.limiter.allow_many(kind, len(urls), backend)
+   ... fetch urls[:n], make do for urls[n:] ...
+
+Each instance has a token bucket, and all instances together count
+fetches per second in the backend's cache (memcache in production), so a
+spike spread over many instances still can't go over GLOBAL_PER_SECOND.
+
+Not every feed is as important.  Vehicle locations are what people are
+looking at; predictions are next; routeConfig rarely changes and we can
+live on an old copy for a long time.  Lower priority fetches leave some
+of the budget untouched for the higher ones, so when we run short
+routeConfigs stop first, then predictions, and vehicle locations last.
+"""
+
+import math
+import time
+import threading
+
+# sustained fetches per second for one instance, and how many it can
+# make at once after a quiet spell
+PER_SECOND = 5.0
+BURST = 20
+
+# fetches per second for all instances together
+GLOBAL_PER_SECOND = 10
+
+# feed kind -> priority, 0 is the most important
+PRIORITIES = {"vehicleLocations": 0,
+              "subway": 0,
+              "predictionsForMultiStops": 1,
+              "predictions": 1,
+              "routeConfig": 2,
+              "routeList": 2}
+LOWEST = 2
+
+# fraction of the budget a fetch of each priority has to leave alone
+RESERVE = {0: 0.0,
+           1: 0.25,
+           2: 0.5}
+
+
+class TokenBucket(object):
+
+    """ /rate/ tokens a second, holding at most /burst/ """
+
+    clock = staticmethod(time.time)
+
+    def __init__(self, rate=PER_SECOND, burst=BURST):
+        self.rate = float(rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last = self.clock()
+        self.lock = threading.Lock()
+
+    def refill(self):
+        """ hold self.lock """
+
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.last)*self.rate)
+        self.last = now
+
+    def available(self, keep=0, n=1):
+        """ how many of /n/ tokens we could take and leave at least /keep/ """
+
+        self.lock.acquire()
+        try:
+            self.refill()
+            return max(0, min(n, int(math.floor(self.tokens - keep))))
+        finally:
+            self.lock.release()
+
+    def take(self, keep=0, n=1):
+        """ take up to /n/ tokens, leaving at least /keep/; how many we
+        took """
+
+        self.lock.acquire()
+        try:
+            self.refill()
+            n = max(0, min(n, int(math.floor(self.tokens - keep))))
+            self.tokens -= n
+            return n
+        finally:
+            self.lock.release()
+
+
+class Limiter(object):
+
+    """ a token bucket for this instance and a per second count for
+    everyone
+
+    denied: feed kind -> fetches we didn't let happen
+    """
+
+    clock = staticmethod(time.time)
+
+    def __init__(self, per_second=PER_SECOND, burst=BURST,
+                 global_per_second=GLOBAL_PER_SECOND):
+        self.bucket = TokenBucket(per_second, burst)
+        self.global_per_second = global_per_second
+        self.denied = {}
+
+    def global_count(self, backend, n=1):
+        """ fetches everyone made this second, including our /n/; None
+        if the backend couldn't say """
+
+        key = "ratelimit:%d" % int(self.clock())
+        try:
+            return backend.incr(key, delta=n, time=10)
+        except Exception:
+            return None
+
+    def allow(self, kind, backend=None):
+        """ may we fetch a /kind/ feed now? """
+
+        return self.allow_many(kind, 1, backend) == 1
+
+    def allow_many(self, kind, n, backend=None):
+        """ how many of /n/ /kind/ fetches may we make now? """
+
+        reserve = RESERVE[PRIORITIES.get(kind, LOWEST)]
+        keep = reserve*self.bucket.burst
+
+        # only ask everyone about what our own bucket would allow, and
+        # only take from it what everyone allowed
+        allowed = self.bucket.available(keep, n)
+        if allowed and backend is not None and self.global_per_second:
+            # if the cache is down we go by our own bucket alone
+            count = self.global_count(backend, allowed)
+            if count is not None:
+                room = (1 - reserve)*self.global_per_second - (count - allowed)
+                allowed = max(0, min(allowed, int(math.floor(room))))
+        allowed = self.bucket.take(keep, allowed)
+
+        if allowed < n:
+            self.denied[kind] = self.denied.get(kind, 0) + n - allowed
+        return allowed
+
+    def dump(self):
+        """ for /stats """
+
+        return {"per_second": self.bucket.rate,
+                "burst": self.bucket.burst,
+                "global_per_second": self.global_per_second,
+                "tokens": round(self.bucket.tokens, 2),
+                "denied": dict(self.denied)}
+
+limiter = Limiter()
@@ -0,0 +1,158 @@
+"""
+Replay a recorded request log through mbtaplot's WSGI application
+
+   python replay.py [options] requests.jsonl
+
+The log has one JSON object per line; lines with a "path" are requests:
+
+   {"path": "/Buses?route=77"}
+   {"path": "/Paths?route=77"}
+
+Lines without a path are skipped.  Upstream feeds come from a fixture
+directory instead of the network, so every run sees the same traffic and
+the same data:
+
+   --fixtures DIR   serve feeds from DIR (required)
+   --record         fetch feeds we don't have from the network and save
+                    them in DIR
+   --latency MS     wait this long before answering each feed fetch
+   --repeat N       go through the log N times (default 1)
+   --sdk DIR        app engine sdk, for webapp
+
+Feeds are cached in a dict rather than memcache, see backends.FixtureBackend.
+
+Reports throughput, latency percentiles for each handler, and how many
+times we went upstream for each kind of feed.
+"""
+
+import sys
+import os
+import time
+import optparse
+import wsgiref.util
+
+import simplejson as json
+import backends
+
+
+def setup_sdk(sdk_dir):
+    """ make the sdk's webapp importable """
+
+    sys.path.insert(0, sdk_dir)
+    import dev_appserver
+    dev_appserver.fix_sys_path()
+
+
+def read_log(fname):
+    """ (paths, number of lines skipped) """
+
+    paths = []
+    skipped = 0
+    for line in open(fname):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            path = json.loads(line).get("path")
+        except (ValueError, AttributeError):
+            path = None
+        if path:
+            paths.append(path)
+        else:
+            skipped += 1
+    return paths, skipped
+
+def request(application, path):
+    """ send one GET through the app; returns (status, body length) """
+
+    environ = {"REQUEST_METHOD": "GET"}
+    wsgiref.util.setup_testing_defaults(environ)
+    environ["PATH_INFO"], _, environ["QUERY_STRING"] = path.partition("?")
+
+    status = []
+    def start_response(s, headers, exc_info=None):
+        status.append(s)
+
+    length = 0
+    for chunk in application(environ, start_response):
+        length += len(chunk)
+    return status[0], length
+
+def percentile(ordered, p):
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered)-1, int(p*len(ordered)))]
+
+def replay(application, paths, repeat=1):
+    """ handler -> [latency in seconds, ...], total elapsed, errors """
+
+    latencies = {}
+    errors = 0
+    start = time.time()
+    for r in range(repeat):
+        for path in paths:
+            handler = path.partition("?")[0]
+            t = time.time()
+            status, length = request(application, path)
+            latencies.setdefault(handler, []).append(time.time() - t)
+            if not status.startswith("200"):
+                errors += 1
+    return latencies, time.time() - start, errors
+
+def report(latencies, elapsed, errors, counts, out=sys.stdout):
+    n = sum(len(l) for l in latencies.values())
+    out.write("%s requests in %.2fs: %.1f req/s, %s errors\n\n" % (
+            n, elapsed, n/max(elapsed, 1e-9), errors))
+
+    out.write("%-16s %7s %9s %9s %9s %9s\n" % (
+            "handler", "count", "p50 ms", "p90 ms", "p99 ms", "max ms"))
+    for handler in sorted(latencies):
+        l = sorted(latencies[handler])
+        out.write("%-16s %7d %9.2f %9.2f %9.2f %9.2f\n" % (
+                handler, len(l),
+                1000*percentile(l, .5), 1000*percentile(l, .9),
+                1000*percentile(l, .99), 1000*l[-1]))
+
+    out.write("\n%-26s %7s\n" % ("upstream feed", "fetches"))
+    for kind in sorted(counts):
+        out.write("%-26s %7d\n" % (kind, counts[kind]))
+
+def start(argv):
+    parser = optparse.OptionParser(usage="%prog [options] requests.jsonl")
+    parser.add_option("--fixtures", help="directory of recorded feeds")
+    parser.add_option("--record", action="store_true",
+                      help="fetch and save feeds missing from the fixtures")
+    parser.add_option("--latency", type="float", default=0,
+                      help="milliseconds to wait before answering each fetch")
+    parser.add_option("--repeat", type="int", default=1)
+    parser.add_option("--sdk", help="app engine sdk directory")
+    options, args = parser.parse_args(argv)
+    if len(args) != 1 or not options.fixtures:
+        parser.error("need a request log and --fixtures")
+
+    if options.record and not os.path.isdir(options.fixtures):
+        os.makedirs(options.fixtures)
+
+    if options.sdk:
+        setup_sdk(options.sdk)
+
+    import feeds
+    import mbtaplot
+    backend = backends.FixtureBackend(options.fixtures, options.latency/1000.0,
+                                      options.record)
+    feeds.backend = backend
+
+    paths, skipped = read_log(args[0])
+    if skipped:
+        sys.stderr.write("skipped %s lines without a path\n" % skipped)
+
+    latencies, elapsed, errors = replay(mbtaplot.application, paths, options.repeat)
+    report(latencies, elapsed, errors, backend.counts)
+
+    if backend.missing:
+        sys.stderr.write("\n%s urls had no fixture, first few:\n" % len(backend.missing))
+        for url in sorted(backend.missing)[:5]:
+            sys.stderr.write("  %s\n" % url)
+
+if __name__ == "__main__":
+    start(sys.argv[1:])
@@ -0,0 +1,216 @@
+"""
+How often to refresh each route's feeds
+
+Routes people are looking at get refreshed often; routes nobody has
+asked about lately, routes with no vehicles on them, and everything late
+at night get refreshed less.  Then, if all that would add up to more
+upstream fetches than our budget, every interval is stretched until it
+fits.
+
+What we know about demand is per instance.  That's a fair sample of
+where users are without a memcache round trip on every request.  Only
+routes in route_table are tracked, and a route is forgotten once nobody
+has asked about it for a while.
+
+   schedule.scheduler.requested(route)            a user asked about route
+   schedule.scheduler.vehicles(route, n)          route has n vehicles now
+   schedule.scheduler.prediction_chunks(route, n) predictions take n fetches
+   schedule.scheduler.vehicle_refresh(route)      seconds between refreshes
+   schedule.scheduler.prediction_refresh(route)
+"""
+
+import math
+import time
+import datetime
+import threading
+
+import dateutil.tz
+
+import route_table
+
+# seconds between vehicle location refreshes
+VEHICLE_MIN, VEHICLE_MAX = 10, 60
+
+# seconds between prediction refreshes
+PREDICTION_MIN, PREDICTION_MAX = 60, 300
+
+# the mbta's own subway feed doesn't update faster than this
+SUBWAY_MIN = 20
+
+# requests per minute from one page open on a route, which polls it four
+# times a minute.  A request means someone's watching now, so it brings
+# a route's demand up to at least this, and a route with this much
+# refreshes as often as it can; as demand decays after they leave, its
+# interval goes back up towards the max.
+WATCHED_DEMAND = 4.0
+
+# how long, in seconds, a request counts towards a route's demand
+DEMAND_TAU = 300.0
+
+# routes with less demand than this (requests per minute) don't count
+# towards the budget
+IDLE_DEMAND = 0.01
+
+# late at night (boston time) everything refreshes this much less often
+NIGHT_HOURS = (1, 5)
+NIGHT_FACTOR = 2.0
+
+# upstream fetches per minute we're willing to make, for all routes together
+BUDGET_PER_MINUTE = 240
+
+tz_boston = dateutil.tz.tzstr('EST5EDT')
+
+
+class RouteDemand(object):
+
+    """ what we know about one route """
+
+    def __init__(self):
+        self.rate = 0.0 # requests per minute, as of last
+        self.last = None
+        self.n_vehicles = None # don't know yet
+        self.chunks = 1 # fetches to get all of a route's predictions
+
+    def demand(self, now):
+        """ requests per minute, decayed to now """
+
+        if self.last is None:
+            return 0.0
+        return self.rate*math.exp(-(now - self.last)/DEMAND_TAU)
+
+    def request(self, now):
+        self.rate = max(self.demand(now) + 60.0/DEMAND_TAU, WATCHED_DEMAND)
+        self.last = now
+
+
+class Scheduler(object):
+
+    """ refresh intervals for every route we've heard about """
+
+    clock = staticmethod(time.time)
+
+    def __init__(self, budget_per_minute=BUDGET_PER_MINUTE, known=None):
+        self.budget_per_minute = budget_per_minute
+        self.known = known # routes we'll track; None for any
+        self.routes = {} # route -> RouteDemand
+        self.lock = threading.Lock()
+        self.stretch = 1.0 # how much we had to stretch intervals to fit the budget
+        self.stretch_at = None
+
+    def route(self, route):
+        """ what we know about /route/; hold self.lock.  A route we
+        don't track gets a RouteDemand that isn't kept """
+
+        if route not in self.routes:
+            if self.known is not None and route not in self.known:
+                return RouteDemand()
+            self.routes[route] = RouteDemand()
+        return self.routes[route]
+
+    def requested(self, route):
+        self.lock.acquire()
+        try:
+            self.route(route).request(self.clock())
+        finally:
+            self.lock.release()
+
+    def vehicles(self, route, n):
+        self.lock.acquire()
+        try:
+            self.route(route).n_vehicles = n
+        finally:
+            self.lock.release()
+
+    def prediction_chunks(self, route, n):
+        self.lock.acquire()
+        try:
+            self.route(route).chunks = max(n, 1)
+        finally:
+            self.lock.release()
+
+    def prune(self, now):
+        """ forget routes nobody has asked about lately; hold self.lock """
+
+        for route, r in self.routes.items():
+            if r.demand(now) < IDLE_DEMAND:
+                del self.routes[route]
+
+    def time_factor(self, now):
+        hour = datetime.datetime.fromtimestamp(now, tz_boston).hour
+        if NIGHT_HOURS[0] <= hour < NIGHT_HOURS[1]:
+            return NIGHT_FACTOR
+        return 1.0
+
+    def base_intervals(self, r, now):
+        """ (vehicle, prediction) seconds for a route, before the budget """
+
+        if r.n_vehicles == 0:
+            # nothing out there to watch move
+            return VEHICLE_MAX, PREDICTION_MAX
+
+        # 0 with no demand, 1 while someone's watching
+        busy = min(1.0, r.demand(now)/WATCHED_DEMAND)
+        factor = self.time_factor(now)
+
+        vehicle = factor*(VEHICLE_MAX - busy*(VEHICLE_MAX - VEHICLE_MIN))
+        prediction = factor*(PREDICTION_MAX - busy*(PREDICTION_MAX - PREDICTION_MIN))
+        return vehicle, prediction
+
+    def budget_stretch(self, now):
+        """ how much to stretch every interval so the routes people are
+        watching fit in the budget; at least 1 """
+
+        # only worth recomputing every few seconds
+        if self.stretch_at is not None and now - self.stretch_at < 5:
+            return self.stretch
+
+        self.prune(now)
+        per_minute = 0.0
+        for r in self.routes.values():
+            vehicle, prediction = self.base_intervals(r, now)
+            per_minute += 60.0/vehicle + 60.0*r.chunks/prediction
+
+        self.stretch = max(1.0, per_minute/self.budget_per_minute)
+        self.stretch_at = now
+        return self.stretch
+
+    def refreshes(self, route):
+        now = self.clock()
+        self.lock.acquire()
+        try:
+            vehicle, prediction = self.base_intervals(self.route(route), now)
+            stretch = self.budget_stretch(now)
+        finally:
+            self.lock.release()
+        return vehicle*stretch, prediction*stretch
+
+    def vehicle_refresh(self, route):
+        vehicle, prediction = self.refreshes(route)
+        return vehicle
+
+    def prediction_refresh(self, route):
+        vehicle, prediction = self.refreshes(route)
+        return prediction
+
+    def dump(self):
+        """ for /stats """
+
+        now = self.clock()
+        self.lock.acquire()
+        try:
+            stretch = self.budget_stretch(now)
+            routes = {}
+            for route, r in self.routes.items():
+                vehicle, prediction = self.base_intervals(r, now)
+                routes[route] = {"demand_per_min": round(r.demand(now), 3),
+                                 "vehicles": r.n_vehicles,
+                                 "vehicle_refresh": round(vehicle*stretch, 1),
+                                 "prediction_refresh": round(prediction*stretch, 1)}
+        finally:
+            self.lock.release()
+
+        return {"budget_per_minute": self.budget_per_minute,
+                "stretch": round(stretch, 3),
+                "routes": routes}
+
+scheduler = Scheduler(known=set(row[0] for row in route_table.table))
@@ -0,0 +1,249 @@
+"""
+Timing what we do, for each request and in aggregate
+
+   with stats.span("fetch"):
+       ...
+
+adds the time taken to the current request's breakdown, and to an
+aggregate histogram for "fetch" that lives as long as the instance does.
+Spans nest, so a span's time includes the spans inside it.
+
+Handlers decorated with @stats.timed start a fresh breakdown for each
+request, log it, and send it back in a Server-Timing header.  Spans
+outside a request (in bench.py, or on a hedged fetch's thread) only go
+into the histograms.
+
+We also count how each kind of feed (vehicleLocations, predictions...,
+routeConfig, subway) is doing: cache hits and misses, fetches that
+worked and didn't, fetches we skipped to stay under the rate
+limit or because the upstream was down, how often we served stale data, and bytes fetched.
+
+The /stats handler dumps all of it.
+"""
+
+from __future__ import with_statement
+import time
+import logging
+import threading
+from contextlib import contextmanager
+
+# upper bounds of histogram buckets, in milliseconds
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class Histogram(object):
+
+    """ counts of values by bucket, plus enough to get a mean """
+
+    def __init__(self, bounds=BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0]*(len(bounds)+1) # last one is for values over the top
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        for n, bound in enumerate(self.bounds):
+            if value <= bound:
+                break
+        else:
+            n = len(self.bounds)
+        self.counts[n] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p):
+        """ upper bound of the bucket the p'th value is in """
+
+        if not self.count:
+            return 0
+        want = p*self.count
+        seen = 0
+        for n, c in enumerate(self.counts):
+            seen += c
+            if seen >= want:
+                if n < len(self.bounds):
+                    return min(self.bounds[n], self.max)
+                return self.max
+        return self.max
+
+    def as_dict(self):
+        buckets = {}
+        for bound, c in zip(self.bounds + ("inf",), self.counts):
+            if c:
+                buckets["<=%s" % bound] = c
+        return {"count": self.count,
+                "total": round(self.total, 1),
+                "mean": round(self.total/max(self.count, 1), 2),
+                "max": round(self.max, 1),
+                "p50": round(self.percentile(.5), 1),
+                "p90": round(self.percentile(.9), 1),
+                "p99": round(self.percentile(.99), 1),
+                "buckets": buckets}
+
+
+class FeedStats(object):
+
+    """ how one kind of feed is doing
+
+    cache_hit:     cached and fresh enough
+    cache_expired: cached but too old, so we fetched
+    cache_miss:    not cached, so we fetched
+    fetch_ok, fetch_failed: how those fetches went
+    throttled:     we were over our fetch budget, so we didn't fetch
+    short_circuited: the upstream has been failing, so we didn't fetch
+    stale_served:  we didn't get a fresh value and used the old one
+    hedged:        a fetch was slow so we sent a second one
+    hedge_won:     and the second one answered first
+    unavailable:   the fetch failed and we had nothing to fall back on
+    bytes:         fetched, from successful fetches
+    """
+
+    COUNTERS = ("cache_hit", "cache_expired", "cache_miss",
+                "fetch_ok", "fetch_failed", "throttled", "short_circuited",
+                "stale_served", "unavailable", "hedged", "hedge_won",
+                "bytes")
+
+    def __init__(self):
+        self.counts = dict.fromkeys(self.COUNTERS, 0)
+        self.fetch_ms = Histogram()
+
+    def as_dict(self):
+        c = self.counts
+        lookups = c["cache_hit"] + c["cache_expired"] + c["cache_miss"]
+        fetches = c["fetch_ok"] + c["fetch_failed"]
+
+        d = dict(c)
+        d["hit_ratio"] = round(float(c["cache_hit"])/max(lookups, 1), 3)
+        d["failure_rate"] = round(float(c["fetch_failed"])/max(fetches, 1), 3)
+        d["fetch_ms"] = self.fetch_ms.as_dict()
+        return d
+
+
+_lock = threading.Lock()
+_timings = {} # span name -> Histogram of milliseconds
+_feeds = {} # feed kind -> FeedStats
+_local = threading.local()
+
+def start_request():
+    """ forget the previous request's breakdown """
+    _local.spans = []
+
+def end_request():
+    """ stop keeping a breakdown on this thread """
+    _local.spans = None
+
+def record(name, ms):
+    spans = getattr(_local, "spans", None)
+    if spans is not None:
+        spans.append((name, ms))
+
+    with _lock:
+        if name not in _timings:
+            _timings[name] = Histogram()
+        _timings[name].add(ms)
+
+@contextmanager
+def span(name):
+    start = time.time()
+    try:
+        yield
+    finally:
+        record(name, 1000*(time.time() - start))
+
+def spanned(f):
+    """ decorator: a span named after the function around every call """
+
+    def spanned_f(*args, **kwargs):
+        with span(f.__name__):
+            return f(*args, **kwargs)
+    spanned_f.__name__ = f.__name__
+    spanned_f.__doc__ = f.__doc__
+    return spanned_f
+
+def feed(kind):
+    """ FeedStats for a kind of feed; hold _lock """
+
+    if kind not in _feeds:
+        _feeds[kind] = FeedStats()
+    return _feeds[kind]
+
+def count(kind, counter, n=1):
+    with _lock:
+        feed(kind).counts[counter] += n
+
+def fetched(kind, ms, ok, nbytes=0):
+    """ a fetch of a /kind/ feed took /ms/ and worked or didn't """
+
+    with _lock:
+        f = feed(kind)
+        f.fetch_ms.add(ms)
+        if ok:
+            f.counts["fetch_ok"] += 1
+            f.counts["bytes"] += nbytes
+        else:
+            f.counts["fetch_failed"] += 1
+    record("fetch", ms)
+
+def fetch_percentile(kind, p, min_fetches=1):
+    """ milliseconds the p'th /kind/ fetch took, or None if we haven't
+    seen min_fetches of them yet """
+
+    with _lock:
+        h = feed(kind).fetch_ms
+        if h.count < min_fetches:
+            return None
+        return h.percentile(p)
+
+def breakdown():
+    """ [(name, count, total ms)] for this request, in the order each
+    name first finished """
+
+    totals = {}
+    order = []
+    for name, ms in getattr(_local, "spans", None) or ():
+        if name not in totals:
+            totals[name] = [0, 0.0]
+            order.append(name)
+        totals[name][0] += 1
+        totals[name][1] += ms
+    return [(name, totals[name][0], totals[name][1]) for name in order]
+
+def server_timing():
+    """ this request's breakdown as a Server-Timing header value """
+
+    return ", ".join('%s;dur=%.1f;desc="%sx"' % (name, ms, count)
+                     for name, count, ms in breakdown())
+
+def timed(get):
+    """ decorator for a handler's get: time the whole request, log the
+    breakdown and send it as Server-Timing """
+
+    def timed_get(self, *args):
+        start_request()
+        try:
+            with span(self.__class__.__name__):
+                return get(self, *args)
+        finally:
+            self.response.headers["Server-Timing"] = server_timing()
+            logging.info("timing %s %s" % (
+                    self.request.path,
+                    " ".join("%s=%.1fms" % (name, ms) for name, count, ms in breakdown())))
+            end_request()
+    timed_get.__name__ = get.__name__
+    timed_get.__doc__ = get.__doc__
+    return timed_get
+
+def dump():
+    """ everything we know, for /stats """
+
+    with _lock:
+        return {"timings_ms": dict((name, h.as_dict()) for name, h in _timings.items()),
+                "feeds": dict((kind, f.as_dict()) for kind, f in _feeds.items())}
+
+def reset():
+    with _lock:
+        _timings.clear()
+        _feeds.clear()
@@ -0,0 +1,533 @@
+"""
+Map tiles drawn on the server, for /tiles
+
+   /tiles/routes/<z>/<x>/<y>.png?routes=1,77,Red   or   ?routes=all
+
+is a 256x256 png of those routes' paths, in google maps' tile scheme, to
+lay over the map with an ImageMapType.  A map of every route is then a
+dozen image loads instead of hundreds of polylines.
+
+   /tiles/density/<z>/<x>/<y>.png?routes=1,77,Red   or   ?routes=all
+
+is a heatmap of where those routes' vehicles are now, from what
+feeds.refresh_vehicles last found, so crowding shows without sending
+every vehicle to every client.
+
+Paths come from feeds.path_cache (routeConfig) and the subway stop list,
+and are drawn the way index.html draws them.  routes=all takes every
+route's routeConfig, which warmup (and cron, for any the rate limit
+held back) loads; its tiles draw whichever have loaded.  A route layer's generation
+is a checksum of everything it draws, so a tile is cached under
+(generation, z, x, y): in an LRU in the instance and in memcache.  When
+routeConfigs change, or a route that failed to load turns up, the
+generation changes and the old tiles are never asked for again.
+Density tiles are only kept in the LRU: their generation is a checksum
+of which cells the routes' vehicles are in, so it changes with nearly
+every refresh, and memcache would fill with tiles nobody asks for again.
+"""
+
+import math
+import time
+import zlib
+import cStringIO
+from array import array
+
+import png
+import icons
+import feeds
+import schedule
+from feeds import is_subway, load_paths, subway_directions
+
+SIZE = 256
+MIN_ZOOM, MAX_ZOOM = 9, 18
+
+# most routes one tile may ask for, besides routes=all; each set of
+# routes is a layer to make, but density tiles are cheap to make for
+# however many routes a page has on it
+MAX_ROUTES = 20
+MAX_DENSITY_ROUTES = 250
+
+# colors as in index.html's get_color("inactive", route)
+COLORS = {"Red": (0xff, 0x00, 0x00),
+          "Orange": (0xff, 0x55, 0x00),
+          "Blue": (0x19, 0x00, 0xff)}
+BUS_COLOR = (0xfe, 0x2e, 0xf7)
+OPACITY = 0.5
+LINE_WIDTH = 3.0
+
+# tiles kept in each instance, and route layers besides routes=all
+TILE_ITEMS = 500
+LAYER_ITEMS = 20
+
+# a layer missing some routes is made again after this long, in case
+# they've loaded since
+RETRY_MISSING = 60
+
+# density tiles: vehicles are binned into cells a pixel across at
+# CELL_ZOOM, and each spreads over RADIUS pixels; density is worked out
+# on the corners of BLOCK pixel blocks, and DENSITY_MAX is as dense as
+# the colors go
+CELL_ZOOM = 15
+RADIUS = 24
+BLOCK = 4
+DENSITY_MAX = 4.0
+DENSITY_COLORS = ((0.0, (0, 0, 255, 0)),
+                  (0.25, (0, 128, 255, 110)),
+                  (0.5, (0, 200, 0, 150)),
+                  (0.75, (255, 220, 0, 180)),
+                  (1.0, (255, 0, 0, 210)))
+
+# a route's vehicles stop being drawn once it's gone this many of its
+# refresh intervals without a refresh
+EXPIRE_REFRESHES = 3
+
+# mercator runs off to infinity at the poles
+MAX_LAT = 85
+
+# bump to make clients and memcache forget tiles drawn the old way
+VERSION = 1
+
+
+class BadTile(ValueError):
+    pass
+
+tile_lru = icons.LRU(TILE_ITEMS)
+layers = icons.LRU(LAYER_ITEMS)
+
+# the routes=all layer, which takes every route's paths to make, so it's
+# kept apart from the LRU; warm_all_layer loads the paths, outside any
+# tile request
+all_layer = None
+
+
+def to_unit(lat, lon):
+    """ lat/lon to web mercator, 0-1 across and down the whole world """
+
+    siny = math.sin(math.radians(lat))
+    return ((lon + 180.0)/360.0,
+            0.5 - math.log((1 + siny)/(1 - siny))/(4*math.pi))
+
+def check_tile(z, x, y):
+    """ ints for a tile's z, x and y; raises BadTile """
+
+    try:
+        z, x, y = int(z), int(x), int(y)
+    except ValueError:
+        raise BadTile("bad tile %s/%s/%s" % (z, x, y))
+    if not MIN_ZOOM <= z <= MAX_ZOOM:
+        raise BadTile("zoom should be %s to %s" % (MIN_ZOOM, MAX_ZOOM))
+    if not (0 <= x < 2**z and 0 <= y < 2**z):
+        raise BadTile("no tile %s/%s/%s" % (z, x, y))
+    return z, x, y
+
+
+class Canvas(object):
+
+    """ coverage of a tile's pixels, one layer for each color, drawn in
+    the order the colors were first used
+
+    layers: [(color, opacity, {pixel index: 0-1})]
+    """
+
+    def __init__(self):
+        self.layers = []
+        self.by_color = {}
+
+    def layer(self, color, opacity):
+        if (color, opacity) not in self.by_color:
+            cover = {}
+            self.by_color[color, opacity] = cover
+            self.layers.append((color, opacity, cover))
+        return self.by_color[color, opacity]
+
+    def stroke(self, cover, x1, y1, x2, y2, width):
+        """ an antialiased line from x1,y1 to x2,y2, in pixels; where
+        lines overlap on a layer the most covered wins, so a layer's
+        lines don't darken each other """
+
+        half = width/2.0
+        reach = half + 1
+        xmin = max(0, int(math.floor(min(x1, x2) - reach)))
+        xmax = min(SIZE-1, int(math.ceil(max(x1, x2) + reach)))
+        ymin = max(0, int(math.floor(min(y1, y2) - reach)))
+        ymax = min(SIZE-1, int(math.ceil(max(y1, y2) + reach)))
+        if xmin > xmax or ymin > ymax:
+            return
+
+        dx, dy = x2 - x1, y2 - y1
+        length2 = dx*dx + dy*dy
+        edge = half + 0.5
+        # how far either side of the line, across a row, a pixel can be
+        # and still be within /edge/ of it
+        spread = dy and abs(edge*math.sqrt(length2)/dy)
+        sqrt = math.sqrt
+        get = cover.get
+        for py in xrange(ymin, ymax+1):
+            cy = py + 0.5
+            row = py*SIZE
+            x_from, x_to = xmin, xmax
+            if spread:
+                middle = x1 + (cy - y1)*dx/dy - 0.5
+                x_from = max(xmin, int(middle - spread))
+                x_to = min(xmax, int(middle + spread) + 1)
+            for px in xrange(x_from, x_to+1):
+                cx = px + 0.5
+                if length2:
+                    t = ((cx - x1)*dx + (cy - y1)*dy)/length2
+                    if t < 0: t = 0.0
+                    elif t > 1: t = 1.0
+                else:
+                    t = 0.0
+                ex, ey = cx - x1 - t*dx, cy - y1 - t*dy
+                c = edge - sqrt(ex*ex + ey*ey)
+                if c > 0:
+                    if c > 1:
+                        c = 1.0
+                    if c > get(row + px, 0):
+                        cover[row + px] = c
+
+    def rows(self):
+        """ png.Writer RGBA rows, each layer over the ones before it """
+
+        pixels = array('B', [0])*(4*SIZE*SIZE)
+        touched = set()
+        for color, opacity, cover in self.layers:
+            touched.update(cover)
+
+        for i in touched:
+            # premultiplied
+            r = g = b = a = 0.0
+            for (lr, lg, lb), opacity, cover in self.layers:
+                la = cover.get(i, 0)*opacity
+                if la:
+                    r = lr*la + r*(1 - la)
+                    g = lg*la + g*(1 - la)
+                    b = lb*la + b*(1 - la)
+                    a = la + a*(1 - la)
+            if a:
+                pixels[4*i:4*i+4] = array('B', (int(r/a + .5), int(g/a + .5),
+                                                int(b/a + .5), int(255*a + .5)))
+
+        return [pixels[4*SIZE*y:4*SIZE*(y+1)] for y in range(SIZE)]
+
+    def png(self):
+        out = cStringIO.StringIO()
+        png.Writer(width=SIZE, height=SIZE, alpha=True,
+                   filter_type=0).write(out, self.rows())
+        return out.getvalue()
+
+
+class RouteLayer(object):
+
+    """ the paths of a set of routes, ready to draw into tiles, from
+    whatever is in feeds.path_cache; loading them is up to the caller
+
+    lines: [(color, [(unit x, unit y), ...], (min x, min y, max x, max y))]
+    missing: routes we couldn't get paths for
+    generation: checksum of everything we'd draw
+    """
+
+    def __init__(self, routes):
+        if routes == "all":
+            routes = sorted(feeds.known_routes)
+        self.routes = routes
+        self.lines = []
+        self.made = time.time()
+
+        bus_routes = [route for route in routes if not is_subway(route)]
+        self.missing = [route for route in bus_routes if route not in feeds.path_cache]
+        for route in bus_routes:
+            if route in feeds.path_cache:
+                directions, stops = feeds.path_cache[route]
+                for tag in sorted(directions):
+                    self.add_line(BUS_COLOR, [(stop.lat, stop.lon)
+                                              for stop in directions[tag].stops])
+
+        # subways go over buses
+        for route in routes:
+            if not is_subway(route):
+                continue
+            try:
+                directions = subway_directions(route)
+            except (feeds.FailedFetchException, KeyError):
+                self.missing.append(route)
+                continue
+            for direction in sorted(directions):
+                if direction != -1:
+                    self.add_line(COLORS[route], [(substop.lat, substop.lon)
+                                                  for substop in directions[direction]])
+
+        crc = zlib.crc32(repr(VERSION))
+        for color, points, bounds in self.lines:
+            crc = zlib.crc32(repr((color, [(round(ux, 9), round(uy, 9))
+                                           for ux, uy in points])), crc)
+        self.generation = "%08x" % (crc & 0xffffffff)
+
+    def add_line(self, color, latlons):
+        points = [to_unit(lat, lon) for lat, lon in latlons]
+        if len(points) < 2:
+            return
+        xs = [ux for ux, uy in points]
+        ys = [uy for ux, uy in points]
+        self.lines.append((color, points, (min(xs), min(ys), max(xs), max(ys))))
+
+    def draw(self, z, x, y):
+        """ png bytes for a tile """
+
+        scale = float(SIZE*2**z)
+        ox, oy = x*SIZE, y*SIZE
+        # lines this far outside the tile might still touch it
+        margin = (LINE_WIDTH + 2)/scale
+        left, top = ox/scale - margin, oy/scale - margin
+        right, bottom = (ox + SIZE)/scale + margin, (oy + SIZE)/scale + margin
+
+        canvas = Canvas()
+        for color, points, (x1, y1, x2, y2) in self.lines:
+            if x2 < left or x1 > right or y2 < top or y1 > bottom:
+                continue
+            cover = canvas.layer(color, OPACITY)
+            last = None
+            for ux, uy in points:
+                here = (ux*scale - ox, uy*scale - oy)
+                if last is not None:
+                    (ax, ay), (bx, by) = last, here
+                    if not (max(ax, bx) < -LINE_WIDTH or min(ax, bx) > SIZE + LINE_WIDTH or
+                            max(ay, by) < -LINE_WIDTH or min(ay, by) > SIZE + LINE_WIDTH):
+                        canvas.stroke(cover, ax, ay, bx, by, LINE_WIDTH)
+                last = here
+        return canvas.png()
+
+
+def parse_routes(routes, max_routes=MAX_ROUTES):
+    """ a sorted tuple of known routes from routes=a,b,c, or "all" """
+
+    if routes == "all":
+        return routes
+    routes = tuple(sorted(set(route for route in routes.split(",") if route)))
+    if not routes:
+        raise BadTile("no routes")
+    if len(routes) > max_routes:
+        raise BadTile("at most %s routes" % max_routes)
+    for route in routes:
+        if route not in feeds.known_routes:
+            raise BadTile("no route %s" % route)
+    return routes
+
+def newer_layer(old, routes):
+    """ a RouteLayer for /routes/ made again, if it has paths /old/
+    didn't; otherwise /old/, so its generation, and the tiles cached
+    under it, stay """
+
+    layer = RouteLayer(routes)
+    if old is None or len(layer.missing) < len(old.missing):
+        return layer
+    old.made = layer.made
+    return old
+
+def route_layer(routes):
+    """ the RouteLayer for /routes/, made again now and then if it's
+    missing some.  routes=all is too many routeConfigs to load for a
+    tile, so it draws the paths we have, and is made again when some it
+    was missing turn up; warm_all_layer loads them """
+
+    global all_layer
+    if routes == "all":
+        if all_layer is None or [route for route in all_layer.missing
+                                 if route in feeds.path_cache]:
+            all_layer = newer_layer(all_layer, routes)
+        return all_layer
+
+    layer = layers.get(routes)
+    if layer is None or layer.missing and time.time() - layer.made > RETRY_MISSING:
+        load_paths([route for route in routes if not is_subway(route)])
+        layer = newer_layer(layer, routes)
+        layers.set(routes, layer)
+    return layer
+
+def warm_all_layer():
+    """ load the paths of every route the routes=all layer is missing,
+    and make it again if that got any; for warmup and cron, not tile
+    requests """
+
+    global all_layer
+    if all_layer is None or all_layer.missing:
+        load_paths([route for route in sorted(feeds.known_routes)
+                    if not is_subway(route)])
+        all_layer = newer_layer(all_layer, "all")
+
+def cache_key(kind, generation, z, x, y):
+    return "tile:%s:%s:%s/%s/%s" % (kind, generation, z, x, y)
+
+def cached_tile(kind, generation, z, x, y, draw, cache=None):
+    """ png bytes for a tile, from the LRU, then /cache/ (a backend),
+    then draw(z, x, y) """
+
+    key = cache_key(kind, generation, z, x, y)
+    data = tile_lru.get(key)
+    if data is not None:
+        return data
+
+    if cache is not None:
+        data = cache.get(key)
+    if data is None:
+        data = draw(z, x, y)
+        if cache is not None:
+            cache.set(key, data)
+    tile_lru.set(key, data)
+    return data
+
+def route_tile(routes, z, x, y, cache=None):
+    """ (generation, png bytes) for a routes tile; raises BadTile """
+
+    z, x, y = check_tile(z, x, y)
+    layer = route_layer(parse_routes(routes))
+    return layer.generation, cached_tile("routes", layer.generation, z, x, y,
+                                         layer.draw, cache)
+
+
+def ramp(stops, n=256):
+    """ a png palette of /n/ RGBA colors, blending between (fraction,
+    (r, g, b, a)) /stops/ """
+
+    palette = []
+    for i in range(n):
+        f = i/float(n - 1)
+        for (f1, c1), (f2, c2) in zip(stops, stops[1:]):
+            if f1 <= f <= f2:
+                u = (f - f1)/(f2 - f1)
+                palette.append(tuple(int(a + (b - a)*u + .5) for a, b in zip(c1, c2)))
+                break
+    return palette
+
+DENSITY_PALETTE = ramp(DENSITY_COLORS)
+
+
+class Density(object):
+
+    """ where each route's vehicles are, binned into cells a pixel across
+    at CELL_ZOOM, for drawing density tiles
+
+    binned: route -> (when feeds refreshed it, {(cell x, cell y): vehicles},
+                      checksum of the cells)
+
+    A route is only binned again when feeds.refresh_vehicles has
+    refreshed it since, and a routes' generation only changes when one
+    of their vehicles changes cells.  Routes nobody has refreshed for
+    EXPIRE_REFRESHES of their refresh intervals aren't drawn; where their
+    vehicles were isn't where they are.
+    """
+
+    def __init__(self):
+        self.binned = {}
+
+    def bin(self, vehicles):
+        n = SIZE*2**CELL_ZOOM
+        cells = {}
+        for vehicle in vehicles:
+            if not -MAX_LAT < vehicle.lat < MAX_LAT:
+                continue
+            ux, uy = to_unit(vehicle.lat, vehicle.lon)
+            cell = int(ux*n), int(uy*n)
+            cells[cell] = cells.get(cell, 0) + 1
+        return cells
+
+    def current(self, routes="all"):
+        """ route -> (cells, checksum) for the /routes/ with vehicles
+        recent enough to draw """
+
+        if routes == "all":
+            routes = feeds.vehicle_cache.keys()
+        now = time.time()
+        current = {}
+        for route in routes:
+            try:
+                timestamp, vehicles = feeds.vehicle_cache[route]
+            except KeyError:
+                continue
+            if now - timestamp > EXPIRE_REFRESHES*schedule.scheduler.vehicle_refresh(route):
+                self.binned.pop(route, None)
+                continue
+
+            binned = self.binned.get(route)
+            if binned is None or binned[0] != timestamp:
+                cells = self.bin(vehicles.values())
+                binned = timestamp, cells, zlib.crc32(repr(sorted(cells.items())))
+                self.binned[route] = binned
+            current[route] = binned[1:]
+        return current
+
+    def generation(self, current):
+        crc = zlib.crc32(repr(VERSION))
+        for route in sorted(current):
+            crc = zlib.crc32(repr((route, current[route][1])), crc)
+        return "%08x" % (crc & 0xffffffff)
+
+    def points(self, current, z, x, y):
+        """ {(pixel x, pixel y): vehicles} for vehicles near enough the
+        tile to show on it """
+
+        # a cell's center, in the tile's pixels
+        scale = 2.0**(z - CELL_ZOOM)
+        ox, oy = x*SIZE, y*SIZE
+        points = {}
+        for cells, crc in current.values():
+            for (cx, cy), count in cells.items():
+                px, py = (cx + .5)*scale - ox, (cy + .5)*scale - oy
+                if -RADIUS < px < SIZE + RADIUS and -RADIUS < py < SIZE + RADIUS:
+                    points[px, py] = points.get((px, py), 0) + count
+        return points
+
+    def draw(self, current, z, x, y):
+        """ png bytes for a tile: a kernel RADIUS pixels across for each
+        vehicle, added up on a grid of BLOCK pixel blocks and blended
+        between them """
+
+        nodes = SIZE/BLOCK + 1
+        grid = [[0.0]*nodes for j in range(nodes)]
+        r2 = float(RADIUS*RADIUS)
+        for (px, py), count in self.points(current, z, x, y).items():
+            # nodes are at the corners of blocks
+            for j in range(max(0, int((py - RADIUS)/BLOCK)),
+                           min(nodes, int((py + RADIUS)/BLOCK) + 2)):
+                dy2 = (j*BLOCK - py)**2
+                row = grid[j]
+                for i in range(max(0, int((px - RADIUS)/BLOCK)),
+                               min(nodes, int((px + RADIUS)/BLOCK) + 2)):
+                    d2 = ((i*BLOCK - px)**2 + dy2)/r2
+                    if d2 < 1:
+                        row[i] += count*(1 - d2)*(1 - d2)
+
+        top = len(DENSITY_PALETTE) - 1
+        level = top/DENSITY_MAX
+        rows = [array('B', [0])*SIZE for v in range(SIZE)]
+        for j in range(nodes - 1):
+            above, below = grid[j], grid[j+1]
+            for i in range(nodes - 1):
+                a, b, c, d = above[i], above[i+1], below[i], below[i+1]
+                if not (a or b or c or d):
+                    continue
+                for v in range(BLOCK):
+                    fv = (v + .5)/BLOCK
+                    left = a + (c - a)*fv
+                    right = b + (d - b)*fv
+                    row = rows[j*BLOCK + v]
+                    for u in range(BLOCK):
+                        value = left + (right - left)*(u + .5)/BLOCK
+                        row[i*BLOCK + u] = min(top, int(value*level))
+
+        out = cStringIO.StringIO()
+        png.Writer(width=SIZE, height=SIZE, palette=DENSITY_PALETTE,
+                   filter_type=0).write(out, rows)
+        return out.getvalue()
+
+density = Density()
+
+def density_tile(routes, z, x, y):
+    """ (generation, png bytes) for a density tile of /routes/ ("all"
+    for every route we have vehicles for); raises BadTile """
+
+    z, x, y = check_tile(z, x, y)
+    current = density.current(parse_routes(routes, MAX_DENSITY_ROUTES))
+    generation = density.generation(current)
+    return generation, cached_tile("density", generation, z, x, y,
+                                   lambda z, x, y: density.draw(current, z, x, y))